@@ -0,0 +1,129 @@
+# article_cache.py
+import hashlib
+import json
+import os
+import tempfile
+from datetime import date, datetime
+
+# Bump whenever the layout of cached data changes; older caches are then ignored.
+CACHE_FORMAT_VERSION = 2
+CACHE_SUFFIX = '.cache'
+
+# Tags for the values yaml.safe_load produces that JSON has no type for
+_DATETIME_TAG = '$datetime'
+_DATE_TAG = '$date'
+
+
+def cache_path_for(source_path):
+    return source_path + CACHE_SUFFIX
+
+
+def write_atomic(content, output_path):
+    # Write to a temporary file and rename so readers never see a partial file
+    output_path = str(output_path)
+    directory = os.path.dirname(output_path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _file_digest(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_fingerprint(stat, content):
+    """Fingerprint the bytes that were parsed, with the os.stat() result taken before reading them."""
+    return {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': hashlib.sha256(content).hexdigest(),
+    }
+
+
+def read_source(source_path):
+    """Read a source file and return its bytes with the fingerprint to cache them under."""
+    stat = os.stat(source_path)
+    with open(source_path, 'rb') as f:
+        content = f.read()
+    return content, source_fingerprint(stat, content)
+
+
+def _encode(value):
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, date):
+        return {_DATE_TAG: value.isoformat()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        if any(not isinstance(key, str) for key in value):
+            raise TypeError('Mappings with non-string keys cannot be cached as JSON')
+        if len(value) == 1 and (_DATETIME_TAG in value or _DATE_TAG in value):
+            raise TypeError('Mapping would be read back as a date')
+        return {key: _encode(item) for key, item in value.items()}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    raise TypeError(f'{type(value).__name__} cannot be cached as JSON')
+
+
+def _decode(obj):
+    if len(obj) == 1:
+        if _DATETIME_TAG in obj:
+            return datetime.fromisoformat(obj[_DATETIME_TAG])
+        if _DATE_TAG in obj:
+            return date.fromisoformat(obj[_DATE_TAG])
+    return obj
+
+
+def write_cache(source_path, data, stage, fingerprint):
+    """Save parsed data next to its source file, tagged with the stage and the fingerprint of the parsed bytes.
+
+    The cache is plain JSON, so loading it can never run code. Data JSON cannot
+    represent faithfully (non-string keys, sets, binary values) is not cached.
+    Returns the cache path, or None when nothing was written.
+    """
+    try:
+        payload = json.dumps({
+            'format': CACHE_FORMAT_VERSION,
+            'stage': stage,
+            'source': fingerprint,
+            'data': _encode(data),
+        }, separators=(',', ':'))
+    except (TypeError, ValueError):
+        return None
+
+    cache_path = cache_path_for(source_path)
+    write_atomic(payload, cache_path)
+    return cache_path
+
+
+def load_cache(source_path, stage):
+    """Return cached data for source_path, or None if missing, stale or from another format version."""
+    try:
+        with open(cache_path_for(source_path), 'r', encoding='utf-8') as f:
+            cache = json.load(f, object_hook=_decode)
+        stat = os.stat(source_path)
+    except (OSError, ValueError, TypeError):
+        return None
+
+    if not isinstance(cache, dict) or cache.get('format') != CACHE_FORMAT_VERSION or cache.get('stage') != stage:
+        return None
+
+    source = cache.get('source')
+    if not isinstance(source, dict) or source.get('size') != stat.st_size:
+        return None
+    # Unchanged size and mtime is trusted; otherwise fall back to comparing content hashes.
+    if source.get('mtime_ns') == stat.st_mtime_ns or source.get('sha256') == _file_digest(source_path):
+        return cache.get('data')
+    return None
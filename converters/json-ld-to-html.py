@@ -1,46 +1,216 @@
 # jsonld_to_html_refactored.py
 import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 import argparse
+from article_cache import load_cache, read_source, write_atomic, write_cache
 
+SECTION_TEMPLATE = Path(__file__).with_name('section.html')
+INDEX_TEMPLATE = Path(__file__).with_name('index_template.html')
+SITE_MANIFEST = '.site-manifest.json'
+SITE_FAILURES = '.site-failures.json'
 
-def load_jsonld(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
 
+def load_jsonld(file_path, use_cache=False):
+    if not use_cache:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
 
-def render_html(data, template_name):
+    cached = load_cache(file_path, stage='jsonld')
+    if cached is not None:
+        return cached
+
+    content, fingerprint = read_source(file_path)
+    data = json.loads(content)
+    write_cache(file_path, data, stage='jsonld', fingerprint=fingerprint)
+    return data
+
+
+@lru_cache(maxsize=None)
+def get_template(template_name):
     env = Environment(
         loader=FileSystemLoader(searchpath=Path(template_name).parent),
         autoescape=select_autoescape(["html", "xml"])
     )
-    template = env.get_template(Path(template_name).name)
-    return template.render(
+    return env.get_template(Path(template_name).name)
+
+
+def _hash_text(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def render_section(part):
+    """Render one hasPart entry through section.html."""
+    return get_template(str(SECTION_TEMPLATE)).render(part=part)
+
+
+def render_html(data, template_name):
+    article_parts = [part for part in data.get("hasPart", []) if part.get('text').strip()]
+    return get_template(template_name).render(
         headline=data.get("headline"),
         author=data.get("author", {}).get("name"),
         datePublished=data.get("datePublished"),
         description=data.get("description"),
-        article_parts=[part for part in data.get("hasPart", []) if part.get('text').strip()]
+        article_parts=article_parts,
+        article_sections=[render_section(part) for part in article_parts]
     )
 
 
 def save_html(html_content, output_path):
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    write_atomic(html_content, output_path)
+
+
+def _file_hash(file_path):
+    return hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+
+
+def build_page(jsonld_path, template_path, output_path, use_cache=False):
+    data = load_jsonld(jsonld_path, use_cache)
+    save_html(render_html(data, template_path), output_path)
+    author = data.get("author", {})
+    return {
+        "headline": data.get("headline") or Path(jsonld_path).stem,
+        "description": data.get("description"),
+        "datePublished": data.get("datePublished"),
+        "author": author.get("name") if isinstance(author, dict) else None,
+    }
+
+
+def build_index_pages(articles, output_dir, page_size=100, title='Articles'):
+    """Render paginated listing pages, rewriting only the pages whose HTML changed."""
+    articles = sorted(articles, key=lambda a: a['headline'])
+    articles.sort(key=lambda a: str(a.get('datePublished') or ''), reverse=True)
+    pages = [articles[i:i + page_size] for i in range(0, len(articles), page_size)] or [[]]
+    names = ['index.html'] + [f'index-{n}.html' for n in range(2, len(pages) + 1)]
+    written = []
+
+    for number, (name, page_articles) in enumerate(zip(names, pages)):
+        html = get_template(str(INDEX_TEMPLATE)).render(
+            title=title,
+            articles=page_articles,
+            previous_page=names[number - 1] if number > 0 else None,
+            next_page=names[number + 1] if number + 1 < len(names) else None,
+        )
+        index_path = Path(output_dir) / name
+        if not index_path.exists() or index_path.read_text(encoding='utf-8') != html:
+            save_html(html, index_path)
+            written.append(name)
+
+    # Drop listing pages left over from a larger corpus
+    for stale in Path(output_dir).glob('index-*.html'):
+        if stale.name not in names:
+            stale.unlink()
+    return written
+
+
+def _load_manifest(manifest_path):
+    empty = {"templates": None, "pages": {}}
+    if not manifest_path.exists():
+        return empty
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Ignoring unreadable {manifest_path} ({e}); rebuilding every page.")
+        return empty
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("pages"), dict):
+        print(f"⚠️ Ignoring malformed {manifest_path}; rebuilding every page.")
+        return empty
+    return manifest
+
+
+def build_site(source_dir, template_path, output_dir, workers=None, page_size=100, use_cache=False):
+    """Render every .jsonld file under source_dir in parallel and generate listing pages.
+
+    Pages are rebuilt only when their source or the templates changed; the
+    manifest in output_dir records what was built from which source hash.
+    Pages that fail to build are listed in the failure report and left out of
+    the manifest and listing pages, so they are retried on the next run.
+    """
+    source_dir, output_dir = Path(source_dir), Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / SITE_MANIFEST
+    failures_path = output_dir / SITE_FAILURES
+
+    manifest = _load_manifest(manifest_path)
+
+    templates_hash = _hash_text(*(Path(t).read_text(encoding='utf-8') for t in (template_path, SECTION_TEMPLATE)))
+    templates_changed = manifest.get("templates") != templates_hash
+
+    sources = sorted(source_dir.rglob('*.jsonld'))
+    pages = {}
+    jobs = []
+    for source in sources:
+        relative = source.relative_to(source_dir).as_posix()
+        page = str(Path(relative).with_suffix('.html').as_posix())
+        source_hash = _file_hash(source)
+        previous = manifest["pages"].get(relative)
+        if previous and previous["hash"] == source_hash and not templates_changed and (output_dir / page).exists():
+            pages[relative] = previous
+        else:
+            jobs.append((relative, source_hash, page))
+
+    failures = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            (relative, source_hash, page,
+             executor.submit(build_page, str(source_dir / relative), str(template_path), str(output_dir / page), use_cache))
+            for relative, source_hash, page in jobs
+        ]
+        for relative, source_hash, page, future in futures:
+            try:
+                pages[relative] = {"hash": source_hash, "url": page, **future.result()}
+            except Exception as e:
+                failures.append({"source": relative, "error": f"{type(e).__name__}: {e}"})
+
+    for relative, entry in manifest["pages"].items():
+        if relative not in pages:
+            stale_page = output_dir / entry["url"]
+            if stale_page.exists():
+                stale_page.unlink()
+
+    index_pages = build_index_pages(pages.values(), output_dir, page_size)
+
+    manifest = {"templates": templates_hash, "pages": dict(sorted(pages.items()))}
+    write_atomic(json.dumps(manifest, indent=2), manifest_path)
+    if failures:
+        write_atomic(json.dumps(failures, indent=2), failures_path)
+    elif failures_path.exists():
+        failures_path.unlink()
+
+    print(f"✅ Site built in {output_dir}: {len(jobs) - len(failures)} of {len(sources)} pages rendered, "
+          f"{len(index_pages)} listing pages updated.")
+    if failures:
+        print(f"❌ {len(failures)} pages failed; see {failures_path}")
+    return manifest
 
 
 def main():
     parser = argparse.ArgumentParser(description='Convert JSON-LD to structured HTML.')
-    parser.add_argument('jsonld_path', help='Path to the JSON-LD file')
+    parser.add_argument('jsonld_path', help='Path to the JSON-LD file (with --site, the source directory)')
     parser.add_argument('template_path', help='Path to the Jinja2 template file')
-    parser.add_argument('output_path', help='Path to save the output HTML file')
+    parser.add_argument('output_path', help='Path to save the output HTML file (with --site, the output directory)')
+    parser.add_argument('--cache', action='store_true', help='Read and write the binary parse cache next to each JSON-LD file')
+    parser.add_argument('--site', action='store_true', help='Render every .jsonld file under jsonld_path as a site')
+    parser.add_argument('--workers', type=int, help='Number of worker processes for --site')
+    parser.add_argument('--page-size', type=int, default=100, help='Articles per listing page for --site')
     args = parser.parse_args()
 
-    data = load_jsonld(args.jsonld_path)
+    if args.site:
+        build_site(args.jsonld_path, args.template_path, args.output_path, args.workers, args.page_size,
+                   use_cache=args.cache)
+        return
+
+    data = load_jsonld(args.jsonld_path, use_cache=args.cache)
     html = render_html(data, args.template_path)
     save_html(html, args.output_path)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,139 @@
+import os
+import pickle
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import article_cache
+from datetime import date, datetime, timezone
+
+from article_cache import cache_path_for, load_cache, read_source, write_cache
+import yaml_to_jsonld
+
+
+class _Exploit:
+    marker = None
+
+    def __reduce__(self):
+        return os.mkdir, (self.marker,)
+
+
+class TestArticleCache(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.work_dir, 'article.yml')
+        with open(self.source, 'w', encoding='utf-8') as f:
+            f.write('headline: Cached\n')
+        self.data = {'headline': 'Cached'}
+        _, fingerprint = read_source(self.source)
+        write_cache(self.source, self.data, stage='yaml', fingerprint=fingerprint)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        self.assertEqual(load_cache(self.source, stage='yaml'), self.data)
+
+    def test_missing_cache(self):
+        os.remove(cache_path_for(self.source))
+        self.assertIsNone(load_cache(self.source, stage='yaml'))
+
+    def test_format_version_bump_invalidates(self):
+        with mock.patch.object(article_cache, 'CACHE_FORMAT_VERSION', article_cache.CACHE_FORMAT_VERSION + 1):
+            self.assertIsNone(load_cache(self.source, stage='yaml'))
+
+    def test_stage_mismatch_invalidates(self):
+        self.assertIsNone(load_cache(self.source, stage='jsonld'))
+
+    def test_size_change_invalidates(self):
+        with open(self.source, 'a', encoding='utf-8') as f:
+            f.write('description: longer\n')
+        self.assertIsNone(load_cache(self.source, stage='yaml'))
+
+    def test_same_size_content_change_invalidates(self):
+        stat = os.stat(self.source)
+        with open(self.source, 'w', encoding='utf-8') as f:
+            f.write('headline: Changed\n')
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertIsNone(load_cache(self.source, stage='yaml'))
+
+    def test_touched_file_with_same_content_uses_hash_fallback(self):
+        stat = os.stat(self.source)
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        with mock.patch.object(article_cache, '_file_digest', wraps=article_cache._file_digest) as digest:
+            self.assertEqual(load_cache(self.source, stage='yaml'), self.data)
+        digest.assert_called_once_with(self.source)
+
+    def test_unchanged_file_skips_hashing(self):
+        with mock.patch.object(article_cache, '_file_digest') as digest:
+            self.assertEqual(load_cache(self.source, stage='yaml'), self.data)
+        digest.assert_not_called()
+
+    def test_corrupt_cache_is_ignored(self):
+        for garbage in (b'', b'not a pickle', b'\x80\x05K\x01.'):
+            with open(cache_path_for(self.source), 'wb') as f:
+                f.write(garbage)
+            self.assertIsNone(load_cache(self.source, stage='yaml'))
+
+
+    def test_pickle_sidecar_is_never_unpickled(self):
+        _Exploit.marker = os.path.join(self.work_dir, 'pwned')
+        with open(cache_path_for(self.source), 'wb') as f:
+            pickle.dump(_Exploit(), f)
+
+        self.assertIsNone(load_cache(self.source, stage='yaml'))
+        self.assertFalse(os.path.exists(_Exploit.marker))
+
+    def test_dates_round_trip(self):
+        data = {'published': date(2025, 4, 2), 'updated': datetime(2025, 4, 2, 12, 0, tzinfo=timezone.utc),
+                'tags': [date(2024, 1, 1), 'text']}
+        _, fingerprint = read_source(self.source)
+        write_cache(self.source, data, stage='yaml', fingerprint=fingerprint)
+
+        self.assertEqual(load_cache(self.source, stage='yaml'), data)
+
+    def test_data_json_cannot_represent_is_not_cached(self):
+        os.remove(cache_path_for(self.source))
+        _, fingerprint = read_source(self.source)
+
+        self.assertIsNone(write_cache(self.source, {1: 'integer key'}, stage='yaml', fingerprint=fingerprint))
+        self.assertFalse(os.path.exists(cache_path_for(self.source)))
+
+    def test_edit_after_read_is_not_cached_as_new_content(self):
+        _, fingerprint = read_source(self.source)
+        stat = os.stat(self.source)
+        with open(self.source, 'w', encoding='utf-8') as f:
+            f.write('headline: Edited\n')
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        write_cache(self.source, self.data, stage='yaml', fingerprint=fingerprint)
+
+        self.assertIsNone(load_cache(self.source, stage='yaml'))
+
+
+class TestYamlStageCache(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.work_dir, 'article.yml')
+        with open(self.source, 'w', encoding='utf-8') as f:
+            f.write('# yaml-language-server: $schema=schema.json\nheadline: Cached\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_cache_is_opt_in(self):
+        self.assertEqual(yaml_to_jsonld.load_yaml_with_schema(self.source), ('schema.json', {'headline': 'Cached'}))
+        self.assertFalse(os.path.exists(cache_path_for(self.source)))
+
+    def test_cached_load_matches_parse(self):
+        parsed = yaml_to_jsonld.load_yaml_with_schema(self.source, use_cache=True)
+
+        self.assertTrue(os.path.exists(cache_path_for(self.source)))
+        self.assertEqual(yaml_to_jsonld.load_yaml_with_schema(self.source, use_cache=True), parsed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import importlib.util
+import json
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+CONVERTERS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CONVERTERS_DIR)
+
+# The script name has hyphens, so load it by path; registering it lets worker processes unpickle build_page
+_spec = importlib.util.spec_from_file_location('json_ld_to_html', os.path.join(CONVERTERS_DIR, 'json-ld-to-html.py'))
+json_ld_to_html = importlib.util.module_from_spec(_spec)
+sys.modules['json_ld_to_html'] = json_ld_to_html
+_spec.loader.exec_module(json_ld_to_html)
+
+build_site = json_ld_to_html.build_site
+
+
+def _article(headline, date):
+    return {
+        "@type": "Article",
+        "headline": headline,
+        "description": f"About {headline}.",
+        "datePublished": date,
+        "author": {"@type": "Person", "name": "Test Author"},
+        "hasPart": [{"@type": "CreativeWork", "name": "Overview", "description": "", "text": f"{headline} body."}],
+    }
+
+
+class TestSiteBuild(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = Path(tempfile.mkdtemp())
+        self.source_dir = self.work_dir / 'jsonld'
+        self.site_dir = self.work_dir / 'site'
+        self.template = self.work_dir / 'template.html'
+        shutil.copy(os.path.join(CONVERTERS_DIR, 'template.html'), self.template)
+
+        self.write_source('alpha.jsonld', _article('Alpha', '2024-01-03'))
+        self.write_source('guides/beta.jsonld', _article('Beta', '2024-01-02'))
+        self.write_source('guides/gamma.jsonld', _article('Gamma', '2024-01-01'))
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def write_source(self, relative, data):
+        path = self.source_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data), encoding='utf-8')
+
+    def build(self, page_size=100):
+        return build_site(self.source_dir, self.template, self.site_dir, workers=2, page_size=page_size)
+
+    def backdate(self, *pages):
+        for page in pages:
+            os.utime(self.site_dir / page, ns=(0, 0))
+
+    def is_rebuilt(self, page):
+        return (self.site_dir / page).stat().st_mtime_ns != 0
+
+    def test_builds_pages_and_manifest(self):
+        manifest = self.build()
+
+        self.assertEqual(sorted(manifest["pages"]), ['alpha.jsonld', 'guides/beta.jsonld', 'guides/gamma.jsonld'])
+        self.assertEqual(manifest["pages"]['guides/beta.jsonld']["url"], 'guides/beta.html')
+        html = (self.site_dir / 'guides' / 'beta.html').read_text(encoding='utf-8')
+        self.assertIn('<h2>Overview</h2>', html)
+        self.assertIn('Beta body.', html)
+        self.assertTrue((self.site_dir / json_ld_to_html.SITE_MANIFEST).exists())
+
+    def test_unchanged_pages_are_skipped(self):
+        self.build()
+        self.backdate('alpha.html', 'guides/beta.html', 'guides/gamma.html')
+        self.write_source('guides/beta.jsonld', _article('Beta', '2024-02-01'))
+
+        self.build()
+
+        self.assertFalse(self.is_rebuilt('alpha.html'))
+        self.assertFalse(self.is_rebuilt('guides/gamma.html'))
+        self.assertTrue(self.is_rebuilt('guides/beta.html'))
+
+    def test_template_change_rebuilds_every_page(self):
+        self.build()
+        self.backdate('alpha.html', 'guides/beta.html', 'guides/gamma.html')
+        self.template.write_text(self.template.read_text(encoding='utf-8').replace('<article>', '<article class="v2">'),
+                                 encoding='utf-8')
+
+        self.build()
+
+        for page in ('alpha.html', 'guides/beta.html', 'guides/gamma.html'):
+            self.assertTrue(self.is_rebuilt(page))
+            self.assertIn('<article class="v2">', (self.site_dir / page).read_text(encoding='utf-8'))
+
+    def test_deleted_source_removes_page(self):
+        self.build()
+        (self.source_dir / 'guides' / 'gamma.jsonld').unlink()
+
+        manifest = self.build()
+
+        self.assertNotIn('guides/gamma.jsonld', manifest["pages"])
+        self.assertFalse((self.site_dir / 'guides' / 'gamma.html').exists())
+        self.assertNotIn('Gamma', (self.site_dir / 'index.html').read_text(encoding='utf-8'))
+
+    def test_pagination(self):
+        self.build(page_size=2)
+
+        first = (self.site_dir / 'index.html').read_text(encoding='utf-8')
+        second = (self.site_dir / 'index-2.html').read_text(encoding='utf-8')
+        # Newest first
+        self.assertLess(first.index('Alpha'), first.index('Beta'))
+        self.assertNotIn('Gamma', first)
+        self.assertIn('href="index-2.html"', first)
+        self.assertIn('href="guides/gamma.html"', second)
+        self.assertIn('href="index.html"', second)
+        self.assertFalse((self.site_dir / 'index-3.html').exists())
+
+    def test_stale_listing_pages_are_removed(self):
+        self.build(page_size=1)
+        self.assertTrue((self.site_dir / 'index-3.html').exists())
+        (self.source_dir / 'guides' / 'beta.jsonld').unlink()
+        (self.source_dir / 'guides' / 'gamma.jsonld').unlink()
+
+        self.build(page_size=1)
+
+        self.assertTrue((self.site_dir / 'index.html').exists())
+        self.assertFalse((self.site_dir / 'index-2.html').exists())
+        self.assertFalse((self.site_dir / 'index-3.html').exists())
+
+    def test_failed_page_is_reported_and_left_out(self):
+        (self.source_dir / 'broken.jsonld').write_text('{"headline": ', encoding='utf-8')
+
+        manifest = self.build()
+
+        self.assertNotIn('broken.jsonld', manifest["pages"])
+        self.assertEqual(len(manifest["pages"]), 3)
+        failures = json.loads((self.site_dir / json_ld_to_html.SITE_FAILURES).read_text(encoding='utf-8'))
+        self.assertEqual([failure["source"] for failure in failures], ['broken.jsonld'])
+        self.assertIn('JSONDecodeError', failures[0]["error"])
+        self.assertFalse((self.site_dir / 'broken.html').exists())
+        self.assertIn('Gamma', (self.site_dir / 'index.html').read_text(encoding='utf-8'))
+
+        self.write_source('broken.jsonld', _article('Fixed', '2024-01-04'))
+        manifest = self.build()
+
+        self.assertIn('broken.jsonld', manifest["pages"])
+        self.assertFalse((self.site_dir / json_ld_to_html.SITE_FAILURES).exists())
+
+    def test_article_without_date(self):
+        article = _article('Undated', None)
+        del article["datePublished"]
+        self.write_source('undated.jsonld', article)
+
+        manifest = self.build()
+
+        self.assertIn('undated.jsonld', manifest["pages"])
+        self.assertIn('By Test Author</p>', (self.site_dir / 'undated.html').read_text(encoding='utf-8'))
+        self.assertFalse((self.site_dir / json_ld_to_html.SITE_FAILURES).exists())
+
+    def test_corrupt_manifest_rebuilds_everything(self):
+        self.build()
+        self.backdate('alpha.html', 'guides/beta.html', 'guides/gamma.html')
+        manifest_path = self.site_dir / json_ld_to_html.SITE_MANIFEST
+        manifest_path.write_text(manifest_path.read_text(encoding='utf-8')[:20], encoding='utf-8')
+
+        manifest = self.build()
+
+        self.assertEqual(len(manifest["pages"]), 3)
+        for page in ('alpha.html', 'guides/beta.html', 'guides/gamma.html'):
+            self.assertTrue(self.is_rebuilt(page))
+        self.assertEqual(json.loads(manifest_path.read_text(encoding='utf-8')), manifest)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ import re
 import sys
 import jsonschema
 from jsonschema import validate
+from article_cache import load_cache, read_source, source_fingerprint, write_cache
 
 def extract_schema_path(yaml_text):
     match = re.search(r'\$schema\s*=\s*(.+)', yaml_text)
@@ -13,11 +14,22 @@ def extract_schema_path(yaml_text):
     else:
         raise ValueError("No $schema directive found at the top of the YAML.")
 
-def load_yaml_with_schema(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        raw_text = f.read()
+def load_yaml_with_schema(filepath, use_cache=False):
+    if use_cache:
+        cached = load_cache(filepath, stage='yaml')
+        if cached is not None:
+            # JSON stores the (schema_path, data) pair as a list
+            schema_path, yaml_data = cached
+            return schema_path, yaml_data
+
+    # Fingerprint the bytes that are parsed, so a concurrent edit cannot be cached under the wrong content
+    raw_bytes, fingerprint = read_source(filepath)
+    raw_text = raw_bytes.decode('utf-8')
     schema_path = extract_schema_path(raw_text)
     yaml_data = yaml.safe_load(raw_text)
+
+    if use_cache:
+        write_cache(filepath, (schema_path, yaml_data), stage='yaml', fingerprint=fingerprint)
     return schema_path, yaml_data
 
 def load_json_schema(schema_path, base_dir):
@@ -44,25 +56,31 @@ def transform_yaml_data(yaml_data):
 
     return yaml_data
 
-def convert_yaml_to_jsonld(input_path):
+def convert_yaml_to_jsonld(input_path, use_cache=False):
     base_dir = os.path.dirname(input_path)
-    schema_path, yaml_data = load_yaml_with_schema(input_path)
+    schema_path, yaml_data = load_yaml_with_schema(input_path, use_cache)
     yaml_data = transform_yaml_data(yaml_data)
 
     schema = load_json_schema(schema_path, base_dir)
     validate_against_schema(yaml_data, schema)
 
     output_path = os.path.splitext(input_path)[0] + '.jsonld'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(yaml_data, f, indent=2, ensure_ascii=False)
+    content = json.dumps(yaml_data, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(output_path, 'wb') as f:
+        f.write(content)
+
+    if use_cache:
+        # Lets json-ld-to-html.py --cache skip parsing the JSON-LD it just produced
+        write_cache(output_path, yaml_data, stage='jsonld', fingerprint=source_fingerprint(os.stat(output_path), content))
 
     print(f"✅ JSON-LD saved to: {output_path}")
     return output_path
 
 if __name__ == '__main__':
-    if len(sys.argv) != 2:
-        print("Usage: python script.py <path/to/input.yaml>")
+    args = [arg for arg in sys.argv[1:] if arg != '--cache']
+    if len(args) != 1:
+        print("Usage: python script.py <path/to/input.yaml> [--cache]")
         sys.exit(1)
 
-    input_yaml_path = sys.argv[1]
-    convert_yaml_to_jsonld(input_yaml_path)
+    input_yaml_path = args[0]
+    convert_yaml_to_jsonld(input_yaml_path, use_cache='--cache' in sys.argv)
@@ -0,0 +1,510 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+from collections import deque
+from functools import lru_cache
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from src.parser.markdown_parser import MarkdownParser
+from src.models.article import Article
+from src.exporter.yaml_exporter import YAMLExporter
+from src.exporter.jsonld_exporter import JSONLDExporter
+from src.utils.validator import Validator
+from src.utils.corpus_index import CorpusIndex, scan_document
+from src.batch.shard import (
+    SHARDS_DIR, describe_corpus, parse_shard_spec, relative_source, select_shard, shard_dir_name,
+)
+
+logger = logging.getLogger(__name__)
+
+# Attempts to hand a job to a fresh worker before it is quarantined as a crash
+MAX_DISPATCH_ATTEMPTS = 3
+
+
+@lru_cache(maxsize=None)
+def _process_validator() -> Validator:
+    """Returns a Validator built once per process and reused by that process's jobs."""
+    return Validator()
+
+
+def convert_file(
+    input_path: str,
+    output_path: str,
+    validate: bool = False,
+    validator: Optional[Validator] = None,
+    index: bool = False,
+    jsonld: bool = False,
+) -> Dict[str, Any]:
+    """
+    Converts a single Markdown file to structured YAML and, optionally, JSON-LD.
+
+    Args:
+        input_path (str): Path to the Markdown source file.
+        output_path (str): Path of the YAML file to write.
+        validate (bool): Validate the article against the schemas before exporting.
+        validator (Optional[Validator]): Shared validator; defaults to one built once per process.
+        index (bool): Include a corpus index entry (anchors, includes, links) in the result.
+        jsonld (bool): Also export Schema.org JSON-LD next to the YAML output.
+
+    Returns:
+        Dict[str, Any]: Summary of the conversion (output paths, unit count, catalog
+        metadata and optional index entry).
+    """
+    md_parser = MarkdownParser(input_path)
+    article_data = md_parser.parse()
+
+    article = Article(metadata=article_data['metadata'], units=article_data['units'])
+
+    if validate:
+        article.validate(validator or _process_validator())
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    YAMLExporter(article, output=output_path).export()
+
+    result = {"output": output_path, "units": len(article.units)}
+    if jsonld:
+        result["jsonld"] = os.path.splitext(output_path)[0] + ".jsonld"
+        JSONLDExporter(article, output=result["jsonld"]).export()
+
+    metadata = article.metadata or {}
+    result["catalog"] = {
+        key: str(metadata[key]) if metadata.get(key) is not None else None
+        for key in ("title", "description", "datePublished")
+    }
+    if index:
+        with open(input_path, "r", encoding="utf-8") as file:
+            content = file.read()
+        result["index"] = scan_document(input_path, content, [unit["title"] for unit in article.units])
+    return result
+
+
+def _current_rss_mb() -> float:
+    """Returns the resident set size of the current process in MiB."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            rss_pages = int(f.read().split()[1])
+        return rss_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        if resource is None:
+            return 0.0
+        # No /proc (e.g. macOS): fall back to peak RSS, which never under-reports, so a
+        # worker over the budget is still recycled. ru_maxrss is in bytes on macOS, KiB elsewhere.
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def _apply_memory_limit(memory_limit_mb: int) -> None:
+    """Caps the address space of the current process at its present size plus the budget."""
+    if resource is None:
+        logger.warning(f"Unable to apply memory limit of {memory_limit_mb} MiB: resource module not available")
+        return
+    try:
+        with open("/proc/self/statm", "r") as f:
+            baseline = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        baseline = 0
+    limit = baseline + memory_limit_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError) as e:
+        logger.warning(f"Unable to apply memory limit of {memory_limit_mb} MiB: {e}")
+
+
+def _worker_loop(conn, task: Callable, memory_limit_mb: Optional[int]) -> None:
+    """Receives jobs over a pipe, runs them and reports status with the worker's RSS."""
+    if memory_limit_mb:
+        _apply_memory_limit(memory_limit_mb)
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+
+        job_id, args = job
+        try:
+            result = task(*args)
+            status, payload = "ok", result
+        except MemoryError:
+            status, payload = "memory", "MemoryError: memory budget exceeded"
+        except Exception as e:
+            status, payload = "error", f"{type(e).__name__}: {e}"
+
+        conn.send((job_id, status, payload, _current_rss_mb()))
+
+    conn.close()
+
+
+class _Worker:
+    """
+    Handle on a single worker process and the job it is currently running.
+    """
+
+    def __init__(self, context, task: Callable, memory_limit_mb: Optional[int]):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_loop,
+            args=(child_conn, task, memory_limit_mb),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks_done = 0
+        self.job = None
+        self.started = None
+
+    def dispatch(self, job_id: int, args: Tuple) -> None:
+        self.job = job_id
+        self.started = time.monotonic()
+        self.conn.send((job_id, args))
+
+    def retire(self) -> None:
+        """Asks the worker to exit cleanly, killing it if it does not."""
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class BatchReport:
+    """
+    Outcome of a batch run: completed conversions and quarantined source files.
+    """
+
+    def __init__(self):
+        self.completed: List[Dict[str, Any]] = []
+        self.quarantined: List[Dict[str, Any]] = []
+        self.workers_started = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the report into a dictionary suitable for serialization.
+
+        Returns:
+            Dict[str, Any]: Counts plus the completed and quarantined entries.
+        """
+        return {
+            "completed": len(self.completed),
+            "quarantined": len(self.quarantined),
+            "workers_started": self.workers_started,
+            "quarantine": self.quarantined,
+        }
+
+
+class BatchRunner:
+    """
+    Runs conversion jobs on a pool of supervised worker processes.
+
+    Each job gets a wall-time budget and each worker a memory budget. Workers
+    are recycled after a fixed number of tasks or when their RSS grows past a
+    threshold. Jobs that time out, exhaust memory, crash their worker or raise
+    are quarantined instead of stalling the remaining jobs.
+    """
+
+    def __init__(
+        self,
+        task: Callable = convert_file,
+        workers: Optional[int] = None,
+        timeout: float = 60.0,
+        memory_limit_mb: Optional[int] = None,
+        max_tasks_per_child: Optional[int] = 100,
+        max_rss_mb: Optional[float] = None,
+        quarantine_dir: Optional[str] = None,
+    ):
+        """
+        Initializes a BatchRunner instance.
+
+        Args:
+            task (Callable): Module-level function run for each job; receives the job's args.
+            workers (Optional[int]): Number of worker processes (defaults to the CPU count).
+            timeout (float): Wall-time budget in seconds for a single job.
+            memory_limit_mb (Optional[int]): Address-space budget per worker in MiB.
+            max_tasks_per_child (Optional[int]): Recycle a worker after this many jobs.
+            max_rss_mb (Optional[float]): Recycle a worker once its RSS exceeds this many MiB.
+            quarantine_dir (Optional[str]): Directory that receives copies of offending source files.
+        """
+        self.task = task
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_tasks_per_child = max_tasks_per_child
+        self.max_rss_mb = max_rss_mb
+        self.quarantine_dir = quarantine_dir
+        self.context = multiprocessing.get_context()
+
+    def run(self, jobs: List[Tuple[str, Tuple]], source_root: Optional[str] = None) -> BatchReport:
+        """
+        Runs all jobs and returns a report.
+
+        Args:
+            jobs (List[Tuple[str, Tuple]]): Pairs of (source path, task args).
+            source_root (Optional[str]): Root used to mirror quarantined files' relative paths.
+
+        Returns:
+            BatchReport: Completed and quarantined jobs.
+        """
+        report = BatchReport()
+        pending = deque(enumerate(jobs))
+        pool: List[_Worker] = []
+        dispatch_failures: Dict[int, int] = {}
+
+        def spawn() -> _Worker:
+            report.workers_started += 1
+            return _Worker(self.context, self.task, self.memory_limit_mb)
+
+        try:
+            pool = [spawn() for _ in range(min(self.workers, len(jobs)))]
+
+            while pending or any(w.job is not None for w in pool):
+                for index, worker in enumerate(pool):
+                    if worker.job is None and pending:
+                        job_id, (source, args) = pending.popleft()
+                        try:
+                            worker.dispatch(job_id, args)
+                        except (BrokenPipeError, EOFError, OSError):
+                            # The idle worker died (e.g. OOM killer); replace it and retry the job
+                            worker.job = None
+                            exitcode = worker.process.exitcode
+                            worker.kill()
+                            dispatch_failures[job_id] = dispatch_failures.get(job_id, 0) + 1
+                            if dispatch_failures[job_id] >= MAX_DISPATCH_ATTEMPTS:
+                                self._quarantine(report, source, "crash", f"Workers died before accepting the job (last exit code {exitcode})", source_root)
+                            else:
+                                logger.warning(f"Worker {worker.process.pid} died while idle (exit code {exitcode}); respawning.")
+                                pending.appendleft((job_id, (source, args)))
+                            pool[index] = spawn()
+
+                busy = [w for w in pool if w.job is not None]
+                if not busy:
+                    continue
+                now = time.monotonic()
+                next_deadline = min(w.started + self.timeout for w in busy)
+                ready = wait([w.conn for w in busy], timeout=max(0.0, next_deadline - now))
+
+                for index, worker in enumerate(pool):
+                    if worker is None or worker.job is None:
+                        continue
+                    source = jobs[worker.job][0]
+
+                    if worker.conn in ready:
+                        try:
+                            job_id, status, payload, rss_mb = worker.conn.recv()
+                        except (EOFError, OSError):
+                            exitcode = worker.process.exitcode
+                            worker.kill()
+                            self._quarantine(report, source, "crash", f"Worker exited with code {exitcode}", source_root)
+                            pool[index] = spawn() if pending else None
+                            continue
+
+                        worker.job = None
+                        worker.tasks_done += 1
+                        if status == "ok":
+                            report.completed.append({"source": source, "result": payload})
+                        else:
+                            self._quarantine(report, source, status, payload, source_root)
+
+                        if self._should_recycle(worker, status, rss_mb):
+                            worker.retire()
+                            pool[index] = spawn() if pending else None
+
+                    elif time.monotonic() - worker.started >= self.timeout:
+                        worker.kill()
+                        self._quarantine(report, source, "timeout", f"Exceeded {self.timeout}s wall-time budget", source_root)
+                        pool[index] = spawn() if pending else None
+
+                pool = [w for w in pool if w is not None]
+        finally:
+            for worker in pool:
+                if worker is not None and worker.process.is_alive():
+                    worker.retire()
+
+        return report
+
+    def _should_recycle(self, worker: _Worker, status: str, rss_mb: float) -> bool:
+        if status == "memory":
+            return True
+        if self.max_tasks_per_child and worker.tasks_done >= self.max_tasks_per_child:
+            return True
+        if self.max_rss_mb and rss_mb > self.max_rss_mb:
+            logger.info(f"Recycling worker {worker.process.pid} at {rss_mb:.1f} MiB RSS")
+            return True
+        return False
+
+    def _quarantine(self, report: BatchReport, source: str, reason: str, detail: str, source_root: Optional[str]) -> None:
+        logger.error(f"Quarantined {source} ({reason}): {detail}")
+        entry = {"source": source, "reason": reason, "detail": detail}
+
+        if self.quarantine_dir and os.path.isfile(source):
+            relative = os.path.relpath(source, source_root) if source_root else os.path.basename(source)
+            target = os.path.join(self.quarantine_dir, relative)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(source, target)
+            entry["copy"] = target
+
+        report.quarantined.append(entry)
+
+
+def discover_markdown(input_dir: str) -> List[str]:
+    """
+    Collects Markdown files below a directory in a stable order.
+
+    Args:
+        input_dir (str): Root directory to search.
+
+    Returns:
+        List[str]: Sorted list of Markdown file paths.
+    """
+    paths = []
+    for root, _, files in os.walk(input_dir):
+        for name in files:
+            if name.endswith(".md"):
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+
+def write_reports(
+    report: BatchReport,
+    report_dir: str,
+    input_dir: str,
+    output_dir: str,
+    shard: Optional[Tuple[int, int]] = None,
+    index: bool = False,
+    check: bool = True,
+    corpus: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Writes the manifest, catalog, quarantine report and optional corpus index of a run.
+
+    Args:
+        report (BatchReport): Outcome of the run.
+        report_dir (str): Directory that receives the reports.
+        input_dir (str): Corpus root the source paths are made relative to.
+        output_dir (str): Output root the YAML and JSON-LD paths are made relative to.
+        shard (Optional[Tuple[int, int]]): Shard number and count, for sharded runs.
+        index (bool): Save the corpus index built from the results.
+        check (bool): Check cross-references now; sharded runs defer this to the merge.
+        corpus (Optional[Dict[str, Any]]): File count and fingerprint of the whole discovered
+            corpus, from describe_corpus; recorded so the merge can verify coverage.
+    """
+    os.makedirs(report_dir, exist_ok=True)
+    completed = sorted(report.completed, key=lambda e: e["source"])
+
+    files, catalog = [], []
+    for entry in completed:
+        source = relative_source(entry["source"], input_dir)
+        result = entry["result"]
+        outputs = {
+            key: os.path.relpath(result[key], output_dir).replace(os.sep, "/")
+            for key in ("output", "jsonld") if key in result
+        }
+        files.append({"source": source, "size": os.path.getsize(entry["source"]), **outputs})
+        catalog.append({"source": source, **outputs, **result["catalog"]})
+
+    quarantine = []
+    for entry in sorted(report.quarantined, key=lambda e: e["source"]):
+        entry = dict(entry, source=relative_source(entry["source"], input_dir))
+        source_path = os.path.join(input_dir, entry["source"])
+        entry["size"] = os.path.getsize(source_path) if os.path.isfile(source_path) else None
+        if "copy" in entry:
+            entry["copy"] = os.path.relpath(entry["copy"], output_dir).replace(os.sep, "/")
+        quarantine.append(entry)
+
+    number, count = shard or (1, 1)
+    manifest = {
+        "shard": {"number": number, "count": count},
+        "corpus": corpus,
+        "input_dir": os.path.abspath(input_dir),
+        "files": files,
+    }
+    quarantine_report = dict(report.to_dict(), quarantine=quarantine)
+    for name, data in (("manifest.json", manifest), ("catalog.json", catalog), ("quarantine.json", quarantine_report)):
+        with open(os.path.join(report_dir, name), "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    if index:
+        corpus_index = CorpusIndex(root=input_dir)
+        for entry in completed:
+            corpus_index.add_entry(entry["result"]["index"])
+        corpus_index.save(os.path.join(report_dir, "corpus-index.json"))
+
+        if check:
+            broken = corpus_index.check()
+            with open(os.path.join(report_dir, "broken-references.json"), "w", encoding="utf-8") as f:
+                json.dump(broken, f, indent=2)
+            logger.info(f"Checked {len(corpus_index.references)} references, {len(broken)} broken.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch Markdown-to-YAML conversion with per-file budgets.")
+    parser.add_argument("--input-dir", required=True, help="Directory containing Markdown files.")
+    parser.add_argument("--output-dir", required=True, help="Directory for YAML output and reports.")
+    parser.add_argument("--workers", type=int, help="Number of worker processes.")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Wall-time budget per file in seconds.")
+    parser.add_argument("--memory-mb", type=int, help="Memory budget per worker in MiB.")
+    parser.add_argument("--max-tasks-per-child", type=int, default=100, help="Recycle workers after this many files.")
+    parser.add_argument("--max-rss-mb", type=float, help="Recycle workers whose RSS exceeds this many MiB.")
+    parser.add_argument("--validate", action="store_true", help="Validate each article against the schemas.")
+    parser.add_argument("--index", action="store_true", help="Build a corpus index and check all cross-references.")
+    parser.add_argument("--jsonld", action="store_true", help="Also export Schema.org JSON-LD for each file.")
+    parser.add_argument("--shard", help="Convert only shard i of N (e.g. 2/8); merge results with src.batch.shard.")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    sources = discover_markdown(args.input_dir)
+    corpus = describe_corpus(sources, args.input_dir)
+    shard = None
+    report_dir = args.output_dir
+    if args.shard:
+        shard = parse_shard_spec(args.shard)
+        sources = select_shard(sources, shard[0], shard[1], args.input_dir)
+        report_dir = os.path.join(args.output_dir, SHARDS_DIR, shard_dir_name(*shard))
+        logging.info(f"Shard {args.shard}: {len(sources)} files.")
+
+    jobs = []
+    for source in sources:
+        relative = os.path.relpath(source, args.input_dir)
+        output_path = os.path.join(args.output_dir, os.path.splitext(relative)[0] + ".yml")
+        jobs.append((source, (source, output_path, args.validate, None, args.index, args.jsonld)))
+
+    runner = BatchRunner(
+        workers=args.workers,
+        timeout=args.timeout,
+        memory_limit_mb=args.memory_mb,
+        max_tasks_per_child=args.max_tasks_per_child,
+        max_rss_mb=args.max_rss_mb,
+        quarantine_dir=os.path.join(report_dir, "quarantine"),
+    )
+    report = runner.run(jobs, source_root=args.input_dir)
+
+    write_reports(report, report_dir, args.input_dir, args.output_dir, shard, args.index,
+                  check=shard is None, corpus=corpus)
+
+    logging.info(f"Converted {len(report.completed)} files, quarantined {len(report.quarantined)}. Reports: {report_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+import argparse
+import glob
+import hashlib
+import heapq
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.corpus_index import CorpusIndex
+
+logger = logging.getLogger(__name__)
+
+SHARDS_DIR = "shards"
+
+
+def parse_shard_spec(spec: str) -> Tuple[int, int]:
+    """
+    Parses a shard specification of the form "i/N" (1-based).
+
+    Args:
+        spec (str): Shard specification, e.g. "2/8".
+
+    Returns:
+        Tuple[int, int]: Shard number and shard count.
+    """
+    try:
+        number, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}'; expected the form i/N, e.g. 2/8.")
+    if count < 1 or not 1 <= number <= count:
+        raise ValueError(f"Invalid shard '{spec}'; i must be between 1 and N.")
+    return number, count
+
+
+def shard_dir_name(number: int, count: int) -> str:
+    return f"shard-{number}-of-{count}"
+
+
+def _path_hash(relative_path: str) -> int:
+    return int(hashlib.sha1(relative_path.encode("utf-8")).hexdigest()[:16], 16)
+
+
+def relative_source(path: str, root: str) -> str:
+    return os.path.relpath(path, root).replace(os.sep, "/")
+
+
+def corpus_fingerprint(files: Iterable[Tuple[str, int]]) -> str:
+    """
+    Hashes a corpus as the sorted list of its (relative path, size) pairs.
+
+    Args:
+        files (Iterable[Tuple[str, int]]): Relative source paths and their sizes in bytes.
+
+    Returns:
+        str: Hex digest that is identical on every node seeing the same corpus.
+    """
+    digest = hashlib.sha256()
+    for relative, size in sorted(files):
+        digest.update(f"{relative}\0{size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def describe_corpus(paths: List[str], root: str) -> Dict[str, Any]:
+    """
+    Summarizes the discovered corpus for the shard manifests.
+
+    Args:
+        paths (List[str]): All source file paths of the corpus.
+        root (str): Corpus root the paths are made relative to.
+
+    Returns:
+        Dict[str, Any]: File count and corpus fingerprint.
+    """
+    files = [(relative_source(path, root), os.path.getsize(path)) for path in paths]
+    return {"files": len(files), "fingerprint": corpus_fingerprint(files)}
+
+
+def assign_shards(paths: List[str], count: int, root: str) -> List[List[str]]:
+    """
+    Splits files into shards that are balanced by size and identical on every node.
+
+    Files are taken largest first, with ties broken by a stable hash of their
+    path relative to root, and each goes to the currently lightest shard. Every
+    node that sees the same corpus therefore computes the same assignment
+    without coordinating, independent of directory listing order.
+
+    Args:
+        paths (List[str]): Source file paths.
+        count (int): Number of shards.
+        root (str): Corpus root the stable hash is computed against.
+
+    Returns:
+        List[List[str]]: Sorted file paths for each shard, in shard order.
+    """
+    keyed = []
+    for path in paths:
+        relative = relative_source(path, root)
+        keyed.append((-os.path.getsize(path), _path_hash(relative), relative, path))
+    keyed.sort()
+
+    # Heap of (load, shard); ties go to the lowest shard number
+    loads = [(0, shard) for shard in range(count)]
+    shards: List[List[str]] = [[] for _ in range(count)]
+    for negative_size, _, _, path in keyed:
+        load, target = heapq.heappop(loads)
+        shards[target].append(path)
+        heapq.heappush(loads, (load - negative_size, target))
+
+    return [sorted(shard) for shard in shards]
+
+
+def select_shard(paths: List[str], number: int, count: int, root: str) -> List[str]:
+    """
+    Returns the files belonging to shard number (1-based) of count.
+
+    Args:
+        paths (List[str]): All source file paths of the corpus.
+        number (int): Shard number, starting at 1.
+        count (int): Number of shards.
+        root (str): Corpus root the stable hash is computed against.
+
+    Returns:
+        List[str]: Sorted file paths of the shard.
+    """
+    return assign_shards(paths, count, root)[number - 1]
+
+
+def _load_json(path: str) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(data: Any, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def merge_shards(shard_dirs: List[str], output_dir: str, input_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Combines the manifests, error reports, catalogs and corpus indexes of all shards.
+
+    Args:
+        shard_dirs (List[str]): Report directories written by each shard run.
+        output_dir (str): Directory that receives the merged reports.
+        input_dir (Optional[str]): Corpus root; defaults to the one recorded in the manifests.
+
+    Returns:
+        Dict[str, Any]: The merged manifest.
+    """
+    manifests = [_load_json(os.path.join(shard_dir, "manifest.json")) for shard_dir in shard_dirs]
+    if not manifests:
+        raise ValueError("No shard outputs to merge.")
+
+    counts = {manifest["shard"]["count"] for manifest in manifests}
+    if len(counts) != 1:
+        raise ValueError(f"Shards come from different splits: counts {sorted(counts)}.")
+    count = counts.pop()
+
+    fingerprints = {manifest.get("corpus", {}).get("fingerprint") for manifest in manifests}
+    if len(fingerprints) != 1 or None in fingerprints:
+        raise ValueError("Shards were run against different corpora; rerun every shard on the same input.")
+    corpus = manifests[0]["corpus"]
+
+    numbers = sorted(manifest["shard"]["number"] for manifest in manifests)
+    if numbers != list(range(1, count + 1)):
+        missing = sorted(set(range(1, count + 1)) - set(numbers))
+        duplicated = sorted({n for n in numbers if numbers.count(n) > 1})
+        raise ValueError(f"Incomplete set of {count} shards: missing {missing}, duplicated {duplicated}.")
+
+    files, catalog, quarantine = [], [], []
+    seen = set()
+    for shard_dir, manifest in zip(shard_dirs, manifests):
+        shard_quarantine = _load_json(os.path.join(shard_dir, "quarantine.json"))["quarantine"]
+        for entry in manifest["files"] + shard_quarantine:
+            if entry["source"] in seen:
+                raise ValueError(f"{entry['source']} was processed by more than one shard.")
+            seen.add(entry["source"])
+        files.extend(manifest["files"])
+        catalog.extend(_load_json(os.path.join(shard_dir, "catalog.json")))
+        quarantine.extend(shard_quarantine)
+
+    # Every discovered file must be either converted or quarantined by exactly one shard
+    covered = [(entry["source"], entry["size"]) for entry in files + quarantine]
+    if len(covered) != corpus["files"] or corpus_fingerprint(covered) != corpus["fingerprint"]:
+        raise ValueError(
+            f"Shards cover {len(covered)} of {corpus['files']} files, or sources changed during the run; "
+            f"the merged output would not match the corpus."
+        )
+
+    input_dir = input_dir or manifests[0]["input_dir"]
+    merged = {
+        "shard": {"number": None, "count": count},
+        "corpus": corpus,
+        "input_dir": input_dir,
+        "files": sorted(files, key=lambda entry: entry["source"]),
+    }
+
+    os.makedirs(output_dir, exist_ok=True)
+    _write_json(merged, os.path.join(output_dir, "manifest.json"))
+    _write_json(sorted(catalog, key=lambda entry: entry["source"]), os.path.join(output_dir, "catalog.json"))
+    quarantine.sort(key=lambda entry: entry["source"])
+    _write_json(
+        {"completed": len(files), "quarantined": len(quarantine), "quarantine": quarantine},
+        os.path.join(output_dir, "quarantine.json"),
+    )
+
+    index_paths = [os.path.join(shard_dir, "corpus-index.json") for shard_dir in shard_dirs]
+    if all(os.path.exists(path) for path in index_paths):
+        corpus_index = CorpusIndex(root=input_dir)
+        for path in index_paths:
+            corpus_index.merge(CorpusIndex.load(path, root=input_dir))
+        corpus_index.save(os.path.join(output_dir, "corpus-index.json"))
+        broken = corpus_index.check()
+        _write_json(broken, os.path.join(output_dir, "broken-references.json"))
+        logger.info(f"Checked {len(corpus_index.references)} references, {len(broken)} broken.")
+
+    logger.info(f"Merged {count} shards: {len(files)} files converted, {len(quarantine)} quarantined.")
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge the outputs of sharded batch runs.")
+    parser.add_argument("--output-dir", required=True, help="Directory for the merged reports.")
+    parser.add_argument("--input-dir", help="Corpus root, if it differs from the one recorded by the shards.")
+    parser.add_argument("shard_dirs", nargs="*", help=f"Shard report directories (default: OUTPUT_DIR/{SHARDS_DIR}/shard-*).")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    shard_dirs = args.shard_dirs or sorted(glob.glob(os.path.join(args.output_dir, SHARDS_DIR, "shard-*")))
+    merge_shards(shard_dirs, args.output_dir, args.input_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import unittest
+import os
+import shutil
+import tempfile
+import time
+import yaml
+from unittest import mock
+from src.batch import runner
+from src.batch.runner import BatchRunner, _Worker, _apply_memory_limit, _current_rss_mb, convert_file
+
+
+def _sleepy_task(path):
+    if "slow" in path:
+        time.sleep(30)
+    return {"pid": os.getpid()}
+
+
+def _crashing_task(path):
+    if "crash" in path:
+        os._exit(3)
+    if "broken" in path:
+        raise ValueError("bad input")
+    return {"pid": os.getpid()}
+
+
+def _hungry_task(path):
+    if "hungry" in path:
+        buffer = bytearray(512 * 1024 * 1024)
+        return {"size": len(buffer)}
+    return {"pid": os.getpid()}
+
+
+class TestBatchRunner(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_convert_markdown_files(self):
+        source = os.path.join(self.work_dir, "article.md")
+        with open(source, "w") as f:
+            f.write("---\ntitle: Batch Article\n---\n\n# Unit Title\nUnit summary.\n\nParagraph content.\n")
+        output = os.path.join(self.work_dir, "out", "article.yml")
+
+        report = BatchRunner(workers=1).run([(source, (source, output))])
+
+        self.assertEqual(len(report.completed), 1)
+        with open(output, "r") as f:
+            content = yaml.safe_load(f)
+        self.assertEqual(content["metadata"]["title"], "Batch Article")
+
+    def test_timeout_quarantines_file(self):
+        jobs = [(name, (name,)) for name in ["a", "slow", "b", "c"]]
+        runner = BatchRunner(task=_sleepy_task, workers=2, timeout=0.5)
+
+        started = time.monotonic()
+        report = runner.run(jobs)
+
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertEqual(sorted(entry["source"] for entry in report.completed), ["a", "b", "c"])
+        self.assertEqual(report.quarantined[0]["source"], "slow")
+        self.assertEqual(report.quarantined[0]["reason"], "timeout")
+
+    def test_crash_and_error_are_quarantined(self):
+        source = os.path.join(self.work_dir, "crash.md")
+        with open(source, "w") as f:
+            f.write("# Crash\n")
+        jobs = [(source, (source,)), ("broken", ("broken",)), ("fine", ("fine",))]
+        quarantine_dir = os.path.join(self.work_dir, "quarantine")
+        runner = BatchRunner(task=_crashing_task, workers=1, quarantine_dir=quarantine_dir)
+
+        report = runner.run(jobs, source_root=self.work_dir)
+
+        reasons = {entry["source"]: entry["reason"] for entry in report.quarantined}
+        self.assertEqual(reasons, {source: "crash", "broken": "error"})
+        self.assertTrue(os.path.exists(os.path.join(quarantine_dir, "crash.md")))
+        self.assertEqual(report.completed[0]["source"], "fine")
+
+    def test_workers_recycled_after_max_tasks(self):
+        jobs = [(str(i), (str(i),)) for i in range(4)]
+        report = BatchRunner(task=_sleepy_task, workers=1, max_tasks_per_child=1).run(jobs)
+
+        pids = {entry["result"]["pid"] for entry in report.completed}
+        self.assertEqual(len(pids), 4)
+        self.assertEqual(report.workers_started, 4)
+
+    def test_memory_budget_quarantines_file(self):
+        jobs = [(name, (name,)) for name in ["a", "hungry", "b"]]
+        report = BatchRunner(task=_hungry_task, workers=1, memory_limit_mb=64).run(jobs)
+
+        self.assertEqual([entry["source"] for entry in report.completed], ["a", "b"])
+        self.assertEqual(report.quarantined[0]["source"], "hungry")
+        self.assertEqual(report.quarantined[0]["reason"], "memory")
+        # The worker that hit its budget is replaced
+        self.assertEqual(report.workers_started, 2)
+
+    def test_workers_recycled_on_rss_growth(self):
+        jobs = [(str(i), (str(i),)) for i in range(3)]
+        report = BatchRunner(task=_sleepy_task, workers=1, max_tasks_per_child=None, max_rss_mb=1).run(jobs)
+
+        pids = {entry["result"]["pid"] for entry in report.completed}
+        self.assertEqual(len(pids), 3)
+        self.assertEqual(report.workers_started, 3)
+
+    def test_dead_idle_worker_is_replaced(self):
+        original_dispatch = _Worker.dispatch
+        killed = []
+
+        def dispatch_to_dead_worker(worker, job_id, args):
+            if not killed:
+                worker.process.kill()
+                worker.process.join()
+                killed.append(worker.process.pid)
+            return original_dispatch(worker, job_id, args)
+
+        jobs = [(name, (name,)) for name in ["a", "b"]]
+        with mock.patch.object(_Worker, "dispatch", dispatch_to_dead_worker):
+            report = BatchRunner(task=_sleepy_task, workers=1).run(jobs)
+
+        self.assertEqual([entry["source"] for entry in report.completed], ["a", "b"])
+        self.assertEqual(report.quarantined, [])
+        self.assertNotIn(killed[0], {entry["result"]["pid"] for entry in report.completed})
+
+    def test_convert_file_function(self):
+        source = os.path.join(self.work_dir, "direct.md")
+        with open(source, "w") as f:
+            f.write("# Direct\nSummary.\n\nText.\n")
+        result = convert_file(source, os.path.join(self.work_dir, "direct.yml"))
+        self.assertEqual(result["units"], 1)
+
+class TestMemoryHelpers(unittest.TestCase):
+    def rss_without_proc(self, platform, max_rss):
+        usage = mock.Mock(ru_maxrss=max_rss)
+        with mock.patch("builtins.open", side_effect=OSError), \
+                mock.patch.object(runner.sys, "platform", platform), \
+                mock.patch.object(runner.resource, "getrusage", return_value=usage):
+            return _current_rss_mb()
+
+    @unittest.skipIf(runner.resource is None, "resource module not available")
+    def test_peak_rss_fallback_units(self):
+        self.assertEqual(self.rss_without_proc("darwin", 300 * 1024 * 1024), 300)
+        self.assertEqual(self.rss_without_proc("linux", 300 * 1024), 300)
+
+    def test_missing_resource_module_warns(self):
+        with mock.patch.object(runner, "resource", None), self.assertLogs("src.batch.runner", level="WARNING") as logs:
+            _apply_memory_limit(256)
+        self.assertIn("256 MiB", logs.output[0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from src.batch.runner import BatchReport, write_reports
+from src.batch.shard import assign_shards, describe_corpus, merge_shards, parse_shard_spec
+
+
+class TestShard(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.input_dir = os.path.join(self.work_dir, "docs")
+        self.paths = []
+        for i in range(9):
+            path = os.path.join(self.input_dir, f"section_{i % 3}", f"article_{i}.md")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            link = f"[next](../section_{(i + 1) % 3}/article_{(i + 1) % 9}.md#unit-{(i + 1) % 9})" if i < 8 else "[bad](../section_0/article_0.md#nope)"
+            with open(path, "w") as f:
+                f.write(
+                    f"---\ntitle: Article {i}\ndescription: Description {i}.\n---\n\n"
+                    f"# Unit {i}\nSummary.\n\n{'Body text. ' * (i * 20 + 1)}\n\nSee {link}.\n"
+                )
+            self.paths.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def run_module(self, *args):
+        subprocess.run([sys.executable, "-m", *args], check=True, capture_output=True)
+
+    def write_shard(self, number, count, completed, quarantined=(), corpus_paths=None):
+        output_dir = os.path.join(self.work_dir, "out")
+        report = BatchReport()
+        for path in completed:
+            output = os.path.join(output_dir, os.path.relpath(path, self.input_dir)[:-3] + ".yml")
+            report.completed.append({"source": path, "result": {"output": output, "catalog": {"title": path}}})
+        for path in quarantined:
+            report.quarantined.append({"source": path, "reason": "error", "detail": "boom"})
+
+        shard_dir = os.path.join(output_dir, "shards", f"shard-{number}-of-{count}")
+        corpus = describe_corpus(self.paths if corpus_paths is None else corpus_paths, self.input_dir)
+        write_reports(report, shard_dir, self.input_dir, output_dir, (number, count), corpus=corpus)
+        return shard_dir
+
+    def test_parse_shard_spec(self):
+        self.assertEqual(parse_shard_spec("2/8"), (2, 8))
+        for spec in ["0/2", "3/2", "2", "a/b"]:
+            with self.assertRaises(ValueError):
+                parse_shard_spec(spec)
+
+    def test_assignment_is_stable_complete_and_balanced(self):
+        shards = assign_shards(self.paths, 3, self.input_dir)
+
+        self.assertEqual(shards, assign_shards(list(reversed(self.paths)), 3, self.input_dir))
+        self.assertEqual(sorted(p for shard in shards for p in shard), sorted(self.paths))
+        loads = [sum(os.path.getsize(p) for p in shard) for shard in shards]
+        self.assertLess(max(loads) - min(loads), max(os.path.getsize(p) for p in self.paths))
+
+    def test_sharded_runs_merge_into_unsharded_result(self):
+        sharded_dir = os.path.join(self.work_dir, "sharded")
+        single_dir = os.path.join(self.work_dir, "single")
+        common = ["--input-dir", self.input_dir, "--workers", "1", "--index", "--jsonld"]
+
+        for shard in ["1/2", "2/2"]:
+            self.run_module("src.batch.runner", *common, "--output-dir", sharded_dir, "--shard", shard)
+        self.run_module("src.batch.shard", "--output-dir", sharded_dir)
+        self.run_module("src.batch.runner", *common, "--output-dir", single_dir)
+
+        for name in ["catalog.json", "broken-references.json"]:
+            with open(os.path.join(sharded_dir, name)) as f_sharded, open(os.path.join(single_dir, name)) as f_single:
+                self.assertEqual(json.load(f_sharded), json.load(f_single))
+
+        with open(os.path.join(sharded_dir, "manifest.json")) as f:
+            manifest = json.load(f)
+        self.assertEqual(len(manifest["files"]), 9)
+        self.assertTrue(os.path.exists(os.path.join(sharded_dir, "section_0", "article_0.jsonld")))
+
+        with open(os.path.join(sharded_dir, "broken-references.json")) as f:
+            broken = json.load(f)
+        self.assertEqual([(b["source"], b["reason"]) for b in broken], [("section_2/article_8.md", "missing-anchor")])
+
+    def test_merge_rejects_incomplete_shards(self):
+        output_dir = os.path.join(self.work_dir, "out")
+        self.run_module("src.batch.runner", "--input-dir", self.input_dir, "--output-dir", output_dir, "--shard", "1/2")
+
+        with self.assertRaises(ValueError):
+            merge_shards([os.path.join(output_dir, "shards", "shard-1-of-2")], output_dir)
+
+    def test_quarantined_files_count_towards_coverage(self):
+        shard_dirs = [
+            self.write_shard(1, 2, self.paths[:4], quarantined=self.paths[4:5]),
+            self.write_shard(2, 2, self.paths[5:]),
+        ]
+
+        merged = merge_shards(shard_dirs, os.path.join(self.work_dir, "out"))
+
+        self.assertEqual(len(merged["files"]), 8)
+        with open(os.path.join(self.work_dir, "out", "quarantine.json")) as f:
+            quarantine = json.load(f)["quarantine"]
+        self.assertEqual([entry["source"] for entry in quarantine], ["section_1/article_4.md"])
+
+    def test_merge_rejects_uncovered_files(self):
+        shard_dirs = [self.write_shard(1, 2, self.paths[:4]), self.write_shard(2, 2, self.paths[5:])]
+
+        with self.assertRaisesRegex(ValueError, "cover 8 of 9"):
+            merge_shards(shard_dirs, os.path.join(self.work_dir, "out"))
+
+    def test_merge_rejects_different_corpora(self):
+        shard_dirs = [
+            self.write_shard(1, 2, self.paths[:4], corpus_paths=self.paths[:4]),
+            self.write_shard(2, 2, self.paths[4:]),
+        ]
+
+        with self.assertRaisesRegex(ValueError, "different corpora"):
+            merge_shards(shard_dirs, os.path.join(self.work_dir, "out"))
+
+    def test_merge_rejects_file_quarantined_by_another_shard(self):
+        shard_dirs = [
+            self.write_shard(1, 2, self.paths[:5]),
+            self.write_shard(2, 2, self.paths[5:], quarantined=self.paths[4:5]),
+        ]
+
+        with self.assertRaisesRegex(ValueError, "more than one shard"):
+            merge_shards(shard_dirs, os.path.join(self.work_dir, "out"))
+
+    def test_merge_rejects_changed_source(self):
+        shard_dirs = [self.write_shard(1, 2, self.paths[:4])]
+        with open(self.paths[8], "a") as f:
+            f.write("Edited after shard 1 ran.\n")
+        shard_dirs.append(self.write_shard(2, 2, self.paths[4:]))
+
+        with self.assertRaises(ValueError):
+            merge_shards(shard_dirs, os.path.join(self.work_dir, "out"))
+
+if __name__ == "__main__":
+    unittest.main()
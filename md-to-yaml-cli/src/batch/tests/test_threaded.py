@@ -0,0 +1,51 @@
+import unittest
+import os
+import shutil
+import tempfile
+from src.batch.threaded import ThreadPoolRunner
+from src.batch.runner import convert_file
+from src.utils.validator import Validator
+
+
+class TestThreadPoolRunner(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.sources = []
+        for i in range(12):
+            source = os.path.join(self.work_dir, f"article_{i}.md")
+            with open(source, "w") as f:
+                f.write(
+                    "---\ntitle: Article {0}\nauthor:\n  name: Author\n  url: https://example.com\n"
+                    "datePublished: \"2025-01-01T10:00:00Z\"\ndescription: Description {0}.\n---\n\n"
+                    "# Unit {0}\nSummary {0}.\n\n{1}\n\n1. Step one\n2. Step two\n".format(i, "Long paragraph text. " * 10)
+                )
+            self.sources.append(source)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_threaded_output_matches_sequential(self):
+        validator = Validator()
+        jobs = [(s, (s, s[:-3] + ".threaded.yml", True, validator)) for s in self.sources]
+
+        report = ThreadPoolRunner(workers=4).run(jobs)
+
+        self.assertEqual(len(report.completed), len(self.sources))
+        self.assertEqual(report.quarantined, [])
+        for source in self.sources:
+            convert_file(source, source[:-3] + ".sequential.yml")
+            with open(source[:-3] + ".threaded.yml") as f_threaded, open(source[:-3] + ".sequential.yml") as f_sequential:
+                self.assertEqual(f_threaded.read(), f_sequential.read())
+
+    def test_failures_are_reported(self):
+        missing = os.path.join(self.work_dir, "missing.md")
+        jobs = [(missing, (missing, missing[:-3] + ".yml")), (self.sources[0], (self.sources[0], self.sources[0][:-3] + ".yml"))]
+
+        report = ThreadPoolRunner(workers=2).run(jobs)
+
+        self.assertEqual(report.completed[0]["source"], self.sources[0])
+        self.assertEqual(report.quarantined[0]["source"], missing)
+        self.assertIn("FileNotFoundError", report.quarantined[0]["detail"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Tuple
+
+from src.batch.runner import BatchReport, convert_file
+
+logger = logging.getLogger(__name__)
+
+
+class ThreadPoolRunner:
+    """
+    Runs conversion jobs concurrently on a thread pool inside the current process.
+
+    MarkdownParser, Validator and YAMLExporter keep no global state, so jobs can
+    share the interpreter (and run in parallel on free-threaded builds) without
+    process-pool overhead. Unlike BatchRunner there are no per-file time or memory
+    budgets: a failing job is reported, but a hanging one holds its thread.
+    """
+
+    def __init__(self, task: Callable = convert_file, workers: Optional[int] = None):
+        """
+        Initializes a ThreadPoolRunner instance.
+
+        Args:
+            task (Callable): Function run for each job; receives the job's args.
+            workers (Optional[int]): Number of threads (defaults to ThreadPoolExecutor's default).
+        """
+        self.task = task
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+
+    def run(self, jobs: List[Tuple[str, Tuple]]) -> BatchReport:
+        """
+        Runs all jobs and returns a report.
+
+        Args:
+            jobs (List[Tuple[str, Tuple]]): Pairs of (source path, task args).
+
+        Returns:
+            BatchReport: Completed jobs and jobs that raised, in submission order.
+        """
+        report = BatchReport()
+        outcomes = [None] * len(jobs)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            report.workers_started = self.workers
+            futures = {executor.submit(self.task, *args): index for index, (_, args) in enumerate(jobs)}
+
+            for future in as_completed(futures):
+                index = futures[future]
+                source = jobs[index][0]
+                try:
+                    outcomes[index] = ("ok", {"source": source, "result": future.result()})
+                except Exception as e:
+                    logger.error(f"Conversion failed for {source}: {e}")
+                    outcomes[index] = ("error", {"source": source, "reason": "error", "detail": f"{type(e).__name__}: {e}"})
+
+        for status, entry in outcomes:
+            (report.completed if status == "ok" else report.quarantined).append(entry)
+
+        return report
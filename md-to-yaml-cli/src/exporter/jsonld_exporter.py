@@ -0,0 +1,294 @@
+import json
+import logging
+import os
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def _component_text(component: Dict[str, Any]) -> str:
+    comp_type, content = next(iter(component.items()))
+    if comp_type == "compParagraph":
+        return content.get("content", "")
+    if comp_type in ("compListOrdered", "compListUnordered"):
+        ordered = comp_type == "compListOrdered"
+        lines = []
+        for number, entry in enumerate(content.get("items", []), 1):
+            marker = f"{number}." if ordered else "-"
+            lines.append(f"{marker} {entry.get('item', '')}")
+        return "\n".join(lines)
+    if comp_type == "compTable":
+        if "raw_table" in content:
+            return content["raw_table"]
+        headers = content.get("headers", [])
+        rows = [" | ".join(str(row.get(h, "")) for h in headers) for row in content.get("rows", [])]
+        return "\n".join([" | ".join(headers)] + rows)
+    if comp_type == "compCodeBlock":
+        return content.get("code", "")
+    if comp_type == "compQuote":
+        return content.get("quote", "")
+    if comp_type == "compImage":
+        return content.get("caption") or content.get("alt", "")
+    return ""
+
+
+def _unit_text(unit: Dict[str, Any]) -> str:
+    return "\n\n".join(text for text in map(_component_text, unit.get("components", [])) if text)
+
+
+def _article_body(article: Dict[str, Any]) -> Any:
+    units = article.get("units")
+    if not units:
+        return _MISSING
+    return "\n\n".join(
+        "\n\n".join(part for part in (unit.get("title", ""), unit.get("summary", ""), _unit_text(unit)) if part)
+        for unit in units
+    )
+
+
+def _has_part(article: Dict[str, Any]) -> Any:
+    units = article.get("units")
+    if not units:
+        return _MISSING
+    return [
+        {
+            "@type": "CreativeWork",
+            "name": unit.get("title", ""),
+            "description": unit.get("summary", ""),
+            "text": _unit_text(unit),
+        }
+        for unit in units
+    ]
+
+
+# Template fields that are computed from the units rather than copied from metadata,
+# with the JSON-LD property they are emitted as.
+DERIVED_FIELDS: Dict[str, Tuple[str, Callable[[Dict[str, Any]], Any]]] = {
+    "articleBody": ("articleBody", _article_body),
+    "articleSection": ("hasPart", _has_part),
+}
+
+
+def _placeholder_key(value: Any) -> str:
+    return json.dumps(value, sort_keys=True)
+
+
+def _collect_placeholders(node: Any, path: Tuple[str, ...], found: Dict[str, Tuple[str, ...]]) -> None:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            _collect_placeholders(value, path + (key,), found)
+    elif isinstance(node, list) and not all(isinstance(item, (str, int, float, bool)) for item in node):
+        return
+    else:
+        found.setdefault(_placeholder_key(node), path)
+
+
+def _json_value(value: Any) -> Any:
+    # YAML loads unquoted dates as date objects, including inside lists and mappings
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, list):
+        return [_json_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _json_value(item) for key, item in value.items()}
+    return value
+
+
+def _make_getter(source: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Any]:
+    def get(article: Dict[str, Any]) -> Any:
+        value = article
+        for key in source:
+            if not isinstance(value, dict) or key not in value:
+                return _MISSING
+            value = value[key]
+        return _json_value(value)
+    return get
+
+
+def _make_name_getter(source: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Any]:
+    # Metadata often gives a person or organization as a bare string ("author: jdoe")
+    get = _make_getter(source)
+
+    def get_name(article: Dict[str, Any]) -> Any:
+        value = get(article)
+        return value if isinstance(value, str) else _MISSING
+    return get_name
+
+
+class JSONLDMapping:
+    """
+    Field mapping from structured articles to Schema.org JSON-LD, compiled from templates.
+
+    Each JSON-LD property is read from the article path named for it in the
+    source annotations (templates/jsonld_sources.json). Properties without an
+    annotation fall back to the metadata path of the YAML article template
+    that holds the same placeholder value. Compilation flattens the result into a list of
+    (target path, getter) pairs and a table of constants (such as ``@type``)
+    seeded when each nested object is created. Applying the mapping is a
+    single loop over that list, with no walking of the template per article.
+    """
+
+    def __init__(self, constants: Dict[str, Any], object_constants: Dict[Tuple[str, ...], Dict[str, Any]],
+                 fields: List[Tuple[Tuple[str, ...], Callable[[Dict[str, Any]], Any]]]):
+        """
+        Initializes a JSONLDMapping instance.
+
+        Args:
+            constants (Dict[str, Any]): Top-level properties copied to every document.
+            object_constants (Dict[Tuple[str, ...], Dict[str, Any]]): Constants for nested objects, by target path.
+            fields (List[Tuple[Tuple[str, ...], Callable]]): Target paths and the getters that fill them.
+        """
+        self.constants = constants
+        self.object_constants = object_constants
+        self.fields = fields
+
+    @classmethod
+    def compile(cls, jsonld_template: Dict[str, Any], article_template: Dict[str, Any],
+                sources: Optional[Dict[str, Optional[str]]] = None) -> "JSONLDMapping":
+        """
+        Compiles a mapping from a JSON-LD template and the matching YAML article template.
+
+        Args:
+            jsonld_template (Dict[str, Any]): Parsed templates/jsonld_template.json.
+            article_template (Dict[str, Any]): Parsed templates/article_template.yml.
+            sources (Optional[Dict[str, Optional[str]]]): Dotted JSON-LD field paths mapped to
+                dotted article paths, e.g. {"headline": "metadata.title"}. None marks a field
+                that is intentionally left out.
+
+        Returns:
+            JSONLDMapping: The compiled mapping.
+        """
+        placeholders: Dict[str, Tuple[str, ...]] = {}
+        _collect_placeholders(article_template.get("metadata", {}), ("metadata",), placeholders)
+        sources = dict(sources or {})
+
+        constants: Dict[str, Any] = {}
+        object_constants: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        fields: List[Tuple[Tuple[str, ...], Callable]] = []
+
+        def visit(node: Dict[str, Any], target: Tuple[str, ...]) -> List[Tuple[str, ...]]:
+            sources_found = []
+            for key, value in node.items():
+                path = target + (key,)
+                dotted = ".".join(path)
+                if not target and key in DERIVED_FIELDS:
+                    name, derive = DERIVED_FIELDS[key]
+                    fields.append(((name,), derive))
+                elif dotted in sources:
+                    source_path = sources.pop(dotted)
+                    if source_path is not None:
+                        source = tuple(source_path.split("."))
+                        fields.append((path, _make_getter(source)))
+                        sources_found.append(source[:-1])
+                elif isinstance(value, dict):
+                    child_sources = visit(value, path)
+                    sources_found.extend(child_sources)
+                    prefix = os.path.commonprefix(child_sources) if child_sources else ()
+                    if "name" in value and len(prefix) > 1:
+                        fields.append((path + ("name",), _make_name_getter(tuple(prefix))))
+                elif _placeholder_key(value) in placeholders:
+                    source = placeholders[_placeholder_key(value)]
+                    fields.append((path, _make_getter(source)))
+                    sources_found.append(source[:-1])
+                elif key.startswith("@"):
+                    (object_constants.setdefault(target, {}) if target else constants)[key] = value
+                else:
+                    logger.warning(f"No source for JSON-LD template field {dotted}; it will not be exported. "
+                                   f"Add it to jsonld_sources.json.")
+            return sources_found
+
+        visit(jsonld_template, ())
+        if sources:
+            raise ValueError(f"Source annotations name fields missing from the JSON-LD template: {sorted(sources)}")
+        return cls(constants, object_constants, fields)
+
+    @classmethod
+    def from_templates(cls, template_dir: str = "templates") -> "JSONLDMapping":
+        """
+        Compiles the mapping from jsonld_template.json and article_template.yml in a directory,
+        with the source annotations in jsonld_sources.json when that file exists.
+
+        Args:
+            template_dir (str): Directory containing the templates.
+
+        Returns:
+            JSONLDMapping: The compiled mapping.
+        """
+        with open(os.path.join(template_dir, "jsonld_template.json"), "r", encoding="utf-8") as f:
+            jsonld_template = json.load(f)
+        with open(os.path.join(template_dir, "article_template.yml"), "r", encoding="utf-8") as f:
+            article_template = yaml.safe_load(f)
+
+        sources = None
+        sources_path = os.path.join(template_dir, "jsonld_sources.json")
+        if os.path.exists(sources_path):
+            with open(sources_path, "r", encoding="utf-8") as f:
+                sources = json.load(f)
+        return cls.compile(jsonld_template, article_template, sources)
+
+    def apply(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Maps one article dictionary (metadata and units) to a JSON-LD document.
+
+        Args:
+            article (Dict[str, Any]): Article as returned by Article.to_dict().
+
+        Returns:
+            Dict[str, Any]: Schema.org Article JSON-LD.
+        """
+        document = dict(self.constants)
+        object_constants = self.object_constants
+
+        for target, get in self.fields:
+            value = get(article)
+            if value is _MISSING:
+                continue
+            node = document
+            for depth in range(len(target) - 1):
+                key = target[depth]
+                if key not in node:
+                    node[key] = dict(object_constants.get(target[:depth + 1], {}))
+                node = node[key]
+            node.setdefault(target[-1], value)
+
+        return document
+
+    def apply_batch(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Maps many article dictionaries with the same compiled mapping.
+
+        Args:
+            articles (List[Dict[str, Any]]): Articles as returned by Article.to_dict().
+
+        Returns:
+            List[Dict[str, Any]]: JSON-LD documents in input order.
+        """
+        apply = self.apply
+        return [apply(article) for article in articles]
+
+
+@lru_cache(maxsize=None)
+def load_mapping(template_dir: str = "templates") -> JSONLDMapping:
+    """Returns the mapping compiled from template_dir, compiling it only once per process."""
+    return JSONLDMapping.from_templates(template_dir)
+
+
+class JSONLDExporter:
+    def __init__(self, article, output="output.jsonld", template_dir="templates"):
+        self.article = article
+        self.output = output
+        self.template_dir = template_dir
+
+    def export(self):
+        document = load_mapping(self.template_dir).apply(self.article.to_dict())
+
+        with open(self.output, "w", encoding="utf-8") as file:
+            json.dump(document, file, indent=2, ensure_ascii=False)
+
+        logger.info(f"JSON-LD exported successfully to {self.output}")
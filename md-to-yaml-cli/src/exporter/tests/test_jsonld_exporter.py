@@ -0,0 +1,121 @@
+import unittest
+import os
+import json
+from datetime import date, datetime, timezone
+from src.models.article import Article
+from src.exporter.jsonld_exporter import JSONLDExporter, JSONLDMapping, load_mapping
+
+class TestJSONLDExporter(unittest.TestCase):
+    def setUp(self):
+        self.article = Article(
+            metadata={
+                "title": "Export Test",
+                "author": {"name": "Author", "url": "https://example.com"},
+                "datePublished": datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc),
+                "description": "Testing export functionality.",
+                "keywords": ["one", "two"]
+            },
+            units=[
+                {
+                    "title": "Test Unit",
+                    "summary": "Testing summary.",
+                    "type": "taskUnit",
+                    "components": [
+                        {"compParagraph": {"content": "This is a paragraph."}},
+                        {"compListOrdered": {"items": [{"item": "First"}, {"item": "Second"}]}}
+                    ]
+                }
+            ]
+        )
+        self.output_file = "test_output.jsonld"
+
+    def tearDown(self):
+        if os.path.exists(self.output_file):
+            os.remove(self.output_file)
+
+    def test_mapping_compiled_from_templates(self):
+        mapping = load_mapping()
+        targets = [target for target, _ in mapping.fields]
+
+        self.assertEqual(mapping.constants, {"@context": "https://schema.org", "@type": "Article"})
+        self.assertIn(("headline",), targets)
+        self.assertIn(("publisher", "logo", "url"), targets)
+        self.assertIn(("hasPart",), targets)
+        self.assertEqual(mapping.object_constants[("author",)], {"@type": "Person"})
+
+    def test_apply_maps_metadata_and_units(self):
+        document = load_mapping().apply(self.article.to_dict())
+
+        self.assertEqual(document["headline"], "Export Test")
+        self.assertEqual(document["author"], {"@type": "Person", "name": "Author", "url": "https://example.com"})
+        self.assertEqual(document["datePublished"], "2025-01-01T10:00:00+00:00")
+        self.assertEqual(document["keywords"], ["one", "two"])
+        self.assertNotIn("publisher", document)
+        self.assertEqual(document["hasPart"], [{
+            "@type": "CreativeWork",
+            "name": "Test Unit",
+            "description": "Testing summary.",
+            "text": "This is a paragraph.\n\n1. First\n2. Second"
+        }])
+        self.assertTrue(document["articleBody"].startswith("Test Unit\n\nTesting summary."))
+
+    def test_string_author_becomes_person(self):
+        metadata = dict(self.article.metadata, author="jdoe")
+        document = load_mapping().apply({"metadata": metadata, "units": []})
+
+        self.assertEqual(document["author"], {"@type": "Person", "name": "jdoe"})
+        self.assertNotIn("hasPart", document)
+
+    def test_apply_batch(self):
+        mapping = JSONLDMapping.from_templates("templates")
+        articles = [{"metadata": {"title": f"Article {i}"}, "units": []} for i in range(3)]
+
+        documents = mapping.apply_batch(articles)
+
+        self.assertEqual([d["headline"] for d in documents], ["Article 0", "Article 1", "Article 2"])
+
+    def test_source_annotation_overrides_placeholder_match(self):
+        jsonld_template = {"@type": "Article", "headline": "Title", "alternativeHeadline": "Title"}
+        article_template = {"metadata": {"title": "Title", "subtitle": "Subtitle"}}
+
+        mapping = JSONLDMapping.compile(jsonld_template, article_template,
+                                        {"alternativeHeadline": "metadata.subtitle"})
+        document = mapping.apply({"metadata": {"title": "Main", "subtitle": "Second"}})
+
+        self.assertEqual(document["headline"], "Main")
+        self.assertEqual(document["alternativeHeadline"], "Second")
+
+    def test_unmapped_field_warns(self):
+        jsonld_template = {"@type": "Article", "headline": "Title", "inLanguage": "en-US", "genre": "Docs"}
+
+        with self.assertLogs("src.exporter.jsonld_exporter", level="WARNING") as logs:
+            mapping = JSONLDMapping.compile(jsonld_template, {"metadata": {"title": "Title"}}, {"genre": None})
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("inLanguage", logs.output[0])
+        self.assertEqual([target for target, _ in mapping.fields], [("headline",)])
+
+    def test_unknown_source_annotation_raises(self):
+        with self.assertRaises(ValueError):
+            JSONLDMapping.compile({"headline": "Title"}, {"metadata": {"title": "Title"}}, {"headlne": "metadata.title"})
+
+    def test_dates_inside_lists_are_converted(self):
+        metadata = dict(self.article.metadata, keywords=["release", date(2025, 3, 1)])
+        JSONLDExporter(Article(metadata=metadata, units=self.article.units), output=self.output_file).export()
+
+        with open(self.output_file, "r") as f:
+            content = json.load(f)
+
+        self.assertEqual(content["keywords"], ["release", "2025-03-01"])
+
+    def test_jsonld_export(self):
+        JSONLDExporter(self.article, output=self.output_file).export()
+
+        with open(self.output_file, "r") as f:
+            content = json.load(f)
+
+        self.assertEqual(content["@type"], "Article")
+        self.assertEqual(content["hasPart"][0]["name"], "Test Unit")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@ import unittest
 import os
 import yaml
 from src.models.article import Article
-from src.exporter.yaml_exporter import YAMLExporter
+from src.exporter.yaml_exporter import YAMLExporter, str_presenter
 
 class TestYAMLExporter(unittest.TestCase):
     def setUp(self):
@@ -42,5 +42,11 @@ class TestYAMLExporter(unittest.TestCase):
         self.assertEqual(content['metadata']['title'], "Export Test")
         self.assertEqual(content['units'][0]['title'], "Test Unit")
 
+    def test_export_leaves_global_yaml_representers_untouched(self):
+        YAMLExporter(self.article, output=self.output_file).export()
+
+        self.assertNotIn(str_presenter, yaml.Dumper.yaml_representers.values())
+        self.assertEqual(yaml.dump("x" * 100), "x" * 100 + "\n...\n")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
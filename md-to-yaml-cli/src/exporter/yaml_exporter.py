@@ -1,7 +1,7 @@
 import yaml
 import logging
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 
 # Custom YAML presenter for better readability (multiline strings)
@@ -11,7 +11,11 @@ def str_presenter(dumper, data):
     return dumper.represent_scalar("tag:yaml.org,2002:str", data)
 
 
-yaml.add_representer(str, str_presenter)
+class ArticleDumper(yaml.Dumper):
+    """YAML dumper with the article presenters registered locally, leaving PyYAML's globals untouched."""
+
+
+ArticleDumper.add_representer(str, str_presenter)
 
 
 class YAMLExporter:
@@ -23,6 +27,7 @@ class YAMLExporter:
     def export(self):
         yaml_content = yaml.dump(
             self.article.to_dict(),
+            Dumper=ArticleDumper,
             sort_keys=False,
             allow_unicode=True,
             default_flow_style=False,
@@ -33,4 +38,4 @@ class YAMLExporter:
             file.write(f"# yaml-language-server: $schema={self.schema_path}\n")
             file.write(yaml_content)
 
-        logging.info(f"YAML exported successfully to {self.output}")
\ No newline at end of file
+        logger.info(f"YAML exported successfully to {self.output}")
\ No newline at end of file
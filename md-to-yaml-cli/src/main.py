@@ -3,24 +3,31 @@ import logging
 from src.parser.markdown_parser import MarkdownParser
 from src.models.article import Article
 from src.exporter.yaml_exporter import YAMLExporter
+from src.exporter.jsonld_exporter import JSONLDExporter
 from src.utils.validator import Validator
 import os
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler("logs/md_to_yaml.log"),
-        logging.StreamHandler()
-    ]
-)
+
+def configure_logging(log_path="logs/md_to_yaml.log"):
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler(log_path),
+            logging.StreamHandler()
+        ]
+    )
 
 
 def main():
+    configure_logging()
+
     parser = argparse.ArgumentParser(description="Markdown-to-YAML structured converter CLI.")
     parser.add_argument("--input", required=True, help="Path to input Markdown file.")
     parser.add_argument("--output", help="Path to output YAML file.")
     parser.add_argument("--validate", action="store_true", help="Validate output against schema.")
+    parser.add_argument("--jsonld", action="store_true", help="Also export Schema.org JSON-LD next to the YAML output.")
 
     args = parser.parse_args()
 
@@ -45,6 +52,11 @@ def main():
     exporter = YAMLExporter(article, output=output_path)
     exporter.export()
 
+    if args.jsonld:
+        jsonld_path = os.path.splitext(output_path)[0] + ".jsonld"
+        logging.info(f"Exporting JSON-LD to: {jsonld_path}")
+        JSONLDExporter(article, output=jsonld_path).export()
+
     logging.info("Markdown-to-YAML conversion complete.")
 
 
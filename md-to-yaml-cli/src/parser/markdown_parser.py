@@ -6,19 +6,22 @@ from typing import Dict, Any, List
 from src.models.component import Component
 from src.models.unit import Unit
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+INCLUDE_PATTERN = re.compile(r'\[!INCLUDE \[.*?\]\((.*?)\)\]')
 
 
 class MarkdownParser:
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, max_include_depth: int = 10):
         self.filepath = filepath
         self.base_path = os.path.dirname(filepath)
+        self.max_include_depth = max_include_depth
 
     def parse(self) -> Dict[str, Any]:
         with open(self.filepath, 'r') as file:
             content = file.read()
 
-        content = self.resolve_includes(content)
+        content = self.resolve_includes(content, seen=frozenset({os.path.realpath(self.filepath)}))
         metadata, markdown_body = self.extract_metadata(content)
         units = self.split_into_units(markdown_body)
 
@@ -26,11 +29,18 @@ class MarkdownParser:
 
         return {"metadata": metadata, "units": structured_units}
 
-    def resolve_includes(self, content: str) -> str:
-        include_pattern = re.compile(r'\[!INCLUDE \[.*?\]\((.*?)\)\]')
-
+    def resolve_includes(self, content: str, depth: int = 0, seen: frozenset = frozenset()) -> str:
         def replace_include(match):
             include_path = os.path.join(self.base_path, match.group(1))
+            resolved_path = os.path.realpath(include_path)
+
+            if depth >= self.max_include_depth:
+                logger.error(f"Include depth limit ({self.max_include_depth}) reached at: {include_path}")
+                return ''
+            if resolved_path in seen:
+                logger.error(f"Include cycle detected: {include_path}")
+                return ''
+
             try:
                 with open(include_path, 'r', encoding='utf-8') as file:
                     included_content = file.read()
@@ -39,12 +49,12 @@ class MarkdownParser:
                 included_body = self.extract_markdown_body(included_content)
 
                 # Recursively resolve nested includes
-                return self.resolve_includes(included_body)
+                return self.resolve_includes(included_body, depth + 1, seen | {resolved_path})
             except FileNotFoundError:
                 logger.error(f"Include file not found: {include_path}")
                 return ''
 
-        return include_pattern.sub(replace_include, content)
+        return INCLUDE_PATTERN.sub(replace_include, content)
 
     def extract_markdown_body(self, content: str) -> str:
         """
@@ -1,5 +1,7 @@
 import unittest
 import os
+import shutil
+import tempfile
 from src.parser.markdown_parser import MarkdownParser
 
 class TestMarkdownParser(unittest.TestCase):
@@ -56,5 +58,42 @@ Subunit summary.
         self.assertEqual(unit2['title'], "Subunit Title")
         self.assertEqual(unit2['type'], "referenceUnit")
 
+    def test_include_cycle_is_cut(self):
+        with open("include_a.md", "w") as f:
+            f.write("Alpha text.\n\n[!INCLUDE [b](include_b.md)]\n")
+        with open("include_b.md", "w") as f:
+            f.write("Beta text.\n\n[!INCLUDE [a](include_a.md)]\n")
+        try:
+            parser = MarkdownParser("include_a.md")
+            with open("include_a.md") as f:
+                content = parser.resolve_includes(f.read(), seen=frozenset({os.path.realpath("include_a.md")}))
+            self.assertIn("Beta text.", content)
+            self.assertNotIn("INCLUDE", content)
+            self.assertEqual(content.count("Alpha text."), 1)
+        finally:
+            os.remove("include_a.md")
+            os.remove("include_b.md")
+
+    def test_nested_include_resolves_against_article_directory(self):
+        work_dir = tempfile.mkdtemp()
+        try:
+            os.makedirs(os.path.join(work_dir, "includes"))
+            files = {
+                "article.md": "# Article\n\n[!INCLUDE [outer](includes/outer.md)]\n",
+                "includes/outer.md": "Outer text.\n\n[!INCLUDE [inner](includes/inner.md)]\n",
+                "includes/inner.md": "Inner text.\n",
+            }
+            for relative, content in files.items():
+                with open(os.path.join(work_dir, relative), "w") as f:
+                    f.write(content)
+
+            parser = MarkdownParser(os.path.join(work_dir, "article.md"))
+            content = parser.resolve_includes(files["article.md"])
+
+            self.assertIn("Outer text.", content)
+            self.assertIn("Inner text.", content)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,260 @@
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional
+from src.parser.markdown_parser import INCLUDE_PATTERN
+
+LINK_PATTERN = re.compile(r'(?<!!)\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+HEADING_PATTERN = re.compile(r'^#{1,6}\s+(.*?)\s*#*\s*$')
+EXTERNAL_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*:')
+
+
+def slugify(title: str) -> str:
+    """
+    Converts a heading into its anchor the way GitHub and docs sites do.
+
+    Args:
+        title (str): Heading text.
+
+    Returns:
+        str: Lowercase anchor with punctuation removed and spaces as hyphens.
+    """
+    slug = re.sub(r'[^\w\- ]', '', title.strip().lower())
+    return slug.replace(' ', '-')
+
+
+def scan_document(source_path: str, content: str, unit_titles: Iterable[str] = ()) -> Dict[str, Any]:
+    """
+    Extracts anchors, include targets and Markdown links from a document in one pass.
+
+    Args:
+        source_path (str): Path of the Markdown source file.
+        content (str): Raw Markdown text of the file, before includes are resolved.
+        unit_titles (Iterable[str]): Unit titles produced by the parser.
+
+    Returns:
+        Dict[str, Any]: Small, picklable entry ready for CorpusIndex.add_entry.
+    """
+    anchors = []
+    seen_counts: Dict[str, int] = {}
+    references = []
+    in_fence = False
+
+    def add_anchor(title):
+        slug = slugify(title)
+        count = seen_counts.get(slug, 0)
+        seen_counts[slug] = count + 1
+        anchors.append(slug if count == 0 else f"{slug}-{count}")
+
+    for lineno, line in enumerate(content.splitlines(), 1):
+        if line.lstrip().startswith(('```', '~~~')):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            add_anchor(heading.group(1))
+
+        for match in INCLUDE_PATTERN.finditer(line):
+            references.append(("include", lineno, match.group(1)))
+        for match in LINK_PATTERN.finditer(INCLUDE_PATTERN.sub('', line)):
+            references.append(("link", lineno, match.group(1)))
+
+    # Units from included files carry anchors of their own
+    for title in unit_titles:
+        if slugify(title) not in seen_counts:
+            add_anchor(title)
+
+    return {"source": source_path, "anchors": anchors, "references": references}
+
+
+class CorpusIndex:
+    """
+    Corpus-wide index of document anchors and cross-references.
+
+    Document paths are interned to integer ids and anchors are held in one
+    frozenset per document, so every link and include in the corpus can be
+    checked with dictionary and set lookups in a single pass.
+    """
+
+    def __init__(self, root: str = "."):
+        """
+        Initializes a CorpusIndex instance.
+
+        Args:
+            root (str): Directory that saved paths are made relative to.
+        """
+        self.root = os.path.abspath(root)
+        self.documents: List[str] = []
+        self.anchors: List[frozenset] = []
+        self.references: List[tuple] = []
+        self._doc_ids: Dict[str, int] = {}
+
+    def _key(self, path: str) -> str:
+        return os.path.normpath(os.path.abspath(path))
+
+    def _intern(self, path: str) -> int:
+        key = self._key(path)
+        doc_id = self._doc_ids.get(key)
+        if doc_id is None:
+            doc_id = len(self.documents)
+            self._doc_ids[key] = doc_id
+            self.documents.append(key)
+            self.anchors.append(frozenset())
+        return doc_id
+
+    def add_entry(self, entry: Dict[str, Any]) -> None:
+        """
+        Adds a document entry produced by scan_document.
+
+        Args:
+            entry (Dict[str, Any]): Entry with source path, anchors and references.
+        """
+        doc_id = self._intern(entry["source"])
+        self.anchors[doc_id] = frozenset(entry["anchors"])
+        for kind, lineno, target in entry["references"]:
+            self.references.append((doc_id, lineno, kind, target))
+
+    def merge(self, other: "CorpusIndex") -> None:
+        """
+        Adds the documents and references of another index, e.g. one built by another shard.
+
+        Args:
+            other (CorpusIndex): Index to merge into this one.
+        """
+        remap = [self._intern(document) for document in other.documents]
+        for doc_id, anchors in zip(remap, other.anchors):
+            self.anchors[doc_id] = self.anchors[doc_id] | anchors
+        for doc_id, lineno, kind, target in other.references:
+            self.references.append((remap[doc_id], lineno, kind, target))
+
+    def check(self) -> List[Dict[str, Any]]:
+        """
+        Validates every recorded reference against the index.
+
+        Links are resolved relative to the document that contains them. Includes
+        are resolved the way MarkdownParser.resolve_includes does: every include,
+        however deeply nested, relative to the directory of the article being
+        converted. Each document is converted as an article of its own, so the
+        includes reachable from it are checked from its directory.
+
+        Returns:
+            List[Dict[str, Any]]: Broken references with source, line, target and reason,
+            plus the converted article for includes broken only inside another article.
+        """
+        broken = []
+        file_exists: Dict[str, bool] = {}
+        includes: Dict[int, List[tuple]] = {}
+
+        for doc_id, lineno, kind, target in self.references:
+            if kind == "include":
+                includes.setdefault(doc_id, []).append((lineno, target))
+                continue
+            reason = self._check_link(doc_id, target, file_exists)
+            if reason:
+                broken.append(self._broken_entry(doc_id, lineno, kind, target, reason))
+
+        for article_id in sorted(includes):
+            broken.extend(self._check_includes(article_id, includes, file_exists))
+
+        broken.sort(key=lambda entry: (entry["source"], entry["line"], entry["target"], entry.get("article", "")))
+        return broken
+
+    def _broken_entry(self, doc_id: int, lineno: int, kind: str, target: str, reason: str) -> Dict[str, Any]:
+        return {
+            "source": os.path.relpath(self.documents[doc_id], self.root),
+            "line": lineno,
+            "kind": kind,
+            "target": target,
+            "reason": reason,
+        }
+
+    def _exists(self, key: str, file_exists: Dict[str, bool]) -> bool:
+        if key in self._doc_ids:
+            return True
+        if key not in file_exists:
+            file_exists[key] = os.path.isfile(key)
+        return file_exists[key]
+
+    def _check_includes(self, article_id: int, includes: Dict[int, List[tuple]],
+                        file_exists: Dict[str, bool]) -> List[Dict[str, Any]]:
+        base_path = os.path.dirname(self.documents[article_id])
+        broken = []
+        visited = {article_id}
+        pending = [article_id]
+
+        while pending:
+            doc_id = pending.pop()
+            for lineno, target in includes.get(doc_id, ()):
+                if EXTERNAL_PATTERN.match(target) or target.startswith('/'):
+                    continue
+                key = os.path.normpath(os.path.join(base_path, target))
+                if not self._exists(key, file_exists):
+                    entry = self._broken_entry(doc_id, lineno, "include", target, "missing-document")
+                    if doc_id != article_id:
+                        entry["article"] = os.path.relpath(self.documents[article_id], self.root)
+                    broken.append(entry)
+                    continue
+                target_id = self._doc_ids.get(key)
+                if target_id is not None and target_id not in visited:
+                    visited.add(target_id)
+                    pending.append(target_id)
+        return broken
+
+    def _check_link(self, doc_id: int, target: str, file_exists: Dict[str, bool]) -> Optional[str]:
+        if EXTERNAL_PATTERN.match(target) or target.startswith('/'):
+            return None
+
+        document = self.documents[doc_id]
+        path, _, anchor = target.partition('#')
+        path = path.split('?', 1)[0]
+        key = os.path.normpath(os.path.join(os.path.dirname(document), path)) if path else document
+
+        if not self._exists(key, file_exists):
+            return "missing-document"
+        target_id = self._doc_ids.get(key)
+        # Present on disk but not converted (e.g. an image or a quarantined file) has no anchors to check
+        if target_id is not None and anchor and anchor.lower() not in self.anchors[target_id]:
+            return "missing-anchor"
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the index into a compact dictionary suitable for serialization.
+
+        Returns:
+            Dict[str, Any]: Relative document paths, sorted anchors and reference tuples.
+        """
+        return {
+            "documents": [os.path.relpath(doc, self.root) for doc in self.documents],
+            "anchors": [sorted(anchors) for anchors in self.anchors],
+            "references": [list(reference) for reference in self.references],
+        }
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str, root: str = ".") -> "CorpusIndex":
+        """
+        Loads an index saved with save().
+
+        Args:
+            path (str): Path of the saved index.
+            root (str): Directory the stored paths are relative to.
+
+        Returns:
+            CorpusIndex: The restored index.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        index = cls(root)
+        for doc_id, (document, anchors) in enumerate(zip(data["documents"], data["anchors"])):
+            index._intern(os.path.join(index.root, document))
+            index.anchors[doc_id] = frozenset(anchors)
+        index.references = [tuple(reference) for reference in data["references"]]
+        return index
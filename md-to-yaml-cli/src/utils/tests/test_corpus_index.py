@@ -0,0 +1,94 @@
+import unittest
+import os
+import shutil
+import tempfile
+from src.utils.corpus_index import CorpusIndex, scan_document, slugify
+
+
+class TestCorpusIndex(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.files = {
+            "guide.md": (
+                "# Getting Started\nIntro.\n\n## Set up your account!\nText.\n\n"
+                "See [details](reference/api.md#request-format) and [local](#getting-started).\n"
+                "Broken [anchor](reference/api.md#nope) and [file](missing.md).\n"
+                "[!INCLUDE [snippet](includes/snippet.md)]\n"
+                "[!INCLUDE [gone](includes/gone.md)]\n"
+                "External [site](https://example.com) and ![image](media/pic.png).\n"
+            ),
+            "reference/api.md": "# API\nSummary.\n\n### Request format\nText.\n\n```\n[not a link](nowhere.md)\n```\n",
+            "includes/snippet.md": (
+                "Snippet text linking [back](../guide.md#set-up-your-account).\n"
+                "[!INCLUDE [nested](nested.md)]\n"
+                "[!INCLUDE [top-level](includes/nested.md)]\n"
+            ),
+            "includes/nested.md": "Nested text.\n",
+        }
+        for relative, content in self.files.items():
+            path = os.path.join(self.work_dir, relative)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(content)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def build_index(self):
+        index = CorpusIndex(root=self.work_dir)
+        for relative, content in self.files.items():
+            index.add_entry(scan_document(os.path.join(self.work_dir, relative), content))
+        return index
+
+    def test_slugify(self):
+        self.assertEqual(slugify("Set up your account!"), "set-up-your-account")
+        self.assertEqual(slugify("What's new in v2.0"), "whats-new-in-v20")
+
+    def test_scan_document(self):
+        entry = scan_document("guide.md", self.files["guide.md"])
+        self.assertEqual(entry["anchors"], ["getting-started", "set-up-your-account"])
+        kinds = [kind for kind, _, _ in entry["references"]]
+        self.assertEqual(kinds.count("include"), 2)
+        self.assertEqual(kinds.count("link"), 5)
+
+    def test_duplicate_headings_get_suffixes(self):
+        entry = scan_document("dup.md", "# Notes\n## Notes\n")
+        self.assertEqual(entry["anchors"], ["notes", "notes-1"])
+
+    def test_check_reports_broken_references(self):
+        broken = self.build_index().check()
+
+        found = {(entry["kind"], entry["target"], entry["reason"]) for entry in broken if entry["source"] == "guide.md"}
+        self.assertEqual(found, {
+            ("link", "reference/api.md#nope", "missing-anchor"),
+            ("link", "missing.md", "missing-document"),
+            ("include", "includes/gone.md", "missing-document"),
+        })
+
+    def test_nested_includes_resolve_against_the_article(self):
+        broken = self.build_index().check()
+
+        nested = {
+            (entry["source"], entry["target"], entry.get("article"))
+            for entry in broken if entry["source"] != "guide.md"
+        }
+        snippet = os.path.join("includes", "snippet.md")
+        # Inside guide.md, "nested.md" resolves next to guide.md; converted on its own, the snippet
+        # resolves "includes/nested.md" to includes/includes/nested.md
+        self.assertEqual(nested, {
+            (snippet, "nested.md", "guide.md"),
+            (snippet, "includes/nested.md", None),
+        })
+
+    def test_save_and_load_round_trip(self):
+        index = self.build_index()
+        index_path = os.path.join(self.work_dir, "corpus-index.json")
+        index.save(index_path)
+
+        loaded = CorpusIndex.load(index_path, root=self.work_dir)
+
+        self.assertEqual(loaded.documents, index.documents)
+        self.assertEqual(loaded.check(), index.check())
+
+if __name__ == "__main__":
+    unittest.main()
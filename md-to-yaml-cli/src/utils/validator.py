@@ -6,7 +6,7 @@ import referencing
 from jsonschema.validators import validator_for
 from referencing import Registry, Resource
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 class Validator:
     def __init__(self, schema_dir="schemas", config_dir="config"):
@@ -24,6 +24,23 @@ class Validator:
         # Set up referencing registry with local schemas
         self.registry = self._setup_registry()
 
+        # Build validators once; they are never mutated afterwards, so one
+        # Validator instance can be shared by concurrent conversions.
+        ArticleValidatorClass = validator_for(self.article_schema)
+        ArticleValidatorClass.check_schema(self.article_schema)
+        self.article_validator = ArticleValidatorClass(
+            schema=self.article_schema,
+            registry=self.registry
+        )
+        self.metadata_validator = jsonschema.Draft7Validator(
+            schema=self.metadata_schema,
+            registry=self.registry
+        )
+        self.component_validators = {
+            comp_type: jsonschema.Draft7Validator(schema=comp_def["schema"], registry=self.registry)
+            for comp_type, comp_def in self.comp_mapping.items()
+        }
+
     def _load_schema(self, schema_filename):
         schema_path = os.path.join(self.schema_dir, schema_filename)
         with open(schema_path, "r", encoding="utf-8") as f:
@@ -51,17 +68,8 @@ class Validator:
     def validate_article(self, article):
         article_dict = article.to_dict()
 
-        # Get appropriate validator class with referencing registry
-        ValidatorClass = validator_for(self.article_schema)
-        ValidatorClass.check_schema(self.article_schema)
-
-        validator = ValidatorClass(
-            schema=self.article_schema,
-            registry=self.registry
-        )
-
-        validator.validate(article_dict)
-        logging.info("✅ Article structure validated successfully.")
+        self.article_validator.validate(article_dict)
+        logger.info("✅ Article structure validated successfully.")
 
         # Validate metadata separately
         self.validate_metadata(article.metadata)
@@ -71,12 +79,8 @@ class Validator:
             self.validate_unit(unit)
 
     def validate_metadata(self, metadata):
-        validator = jsonschema.Draft7Validator(
-            schema=self.metadata_schema,
-            registry=self.registry
-        )
-        validator.validate(metadata)
-        logging.info("✅ Metadata validated successfully.")
+        self.metadata_validator.validate(metadata)
+        logger.info("✅ Metadata validated successfully.")
 
     def validate_unit(self, unit):
         required_fields = ["title", "summary", "type", "components"]
@@ -100,19 +104,14 @@ class Validator:
         for comp in unit["components"]:
             self.validate_component(comp)
 
-        logging.info(f"✅ Unit '{unit['title']}' validated successfully.")
+        logger.info(f"✅ Unit '{unit['title']}' validated successfully.")
 
     def validate_component(self, component):
         comp_type, comp_content = next(iter(component.items()))
 
-        if comp_type not in self.comp_mapping:
+        if comp_type not in self.component_validators:
             raise jsonschema.ValidationError(f"❌ Unrecognized component type '{comp_type}'.")
 
-        comp_schema = self.comp_mapping[comp_type]["schema"]
-        validator = jsonschema.Draft7Validator(
-            schema=comp_schema,
-            registry=self.registry
-        )
-        validator.validate(comp_content)
+        self.component_validators[comp_type].validate(comp_content)
 
-        logging.info(f"✅ Component '{comp_type}' validated successfully.")
+        logger.info(f"✅ Component '{comp_type}' validated successfully.")
@@ -1,12 +1,22 @@
 import unittest
 from src.parser.tests.test_markdown_parser import TestMarkdownParser
 from src.utils.tests.test_validator import TestValidator
+from src.utils.tests.test_corpus_index import TestCorpusIndex
 from src.exporter.tests.test_yaml_exporter import TestYAMLExporter
+from src.exporter.tests.test_jsonld_exporter import TestJSONLDExporter
+from src.batch.tests.test_runner import TestBatchRunner
+from src.batch.tests.test_threaded import TestThreadPoolRunner
+from src.batch.tests.test_shard import TestShard
 
 if __name__ == '__main__':
     suite = unittest.TestSuite()
     suite.addTests(unittest.makeSuite(TestMarkdownParser))
     suite.addTests(unittest.makeSuite(TestValidator))
+    suite.addTests(unittest.makeSuite(TestCorpusIndex))
     suite.addTests(unittest.makeSuite(TestYAMLExporter))
+    suite.addTests(unittest.makeSuite(TestJSONLDExporter))
+    suite.addTests(unittest.makeSuite(TestBatchRunner))
+    suite.addTests(unittest.makeSuite(TestThreadPoolRunner))
+    suite.addTests(unittest.makeSuite(TestShard))
     runner = unittest.TextTestRunner()
     runner.run(suite)
\ No newline at end of file